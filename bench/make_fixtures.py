@@ -0,0 +1,116 @@
+"""Generate the synthetic replay fixtures in bench/fixtures.
+
+    python bench/make_fixtures.py [--screens 3600] [--show-lines 20000]
+
+status_timer_run.jsonl.gz  a --status --status-timer 1 run on two devices:
+                           one status screen per second, cracked hashes in
+                           between and device temperatures that climb past
+                           90c, so the thermal governor has something to do.
+show_dump.jsonl.gz         a large "hashcat --show" dump of hash:plain lines
+                           written in 64 KiB bursts, as hashcat does.
+
+Output mirrors hashcat 6.2's status screen; the generator is seeded, so
+regenerating produces the same recordings.
+"""
+import argparse
+import hashlib
+import os
+import random
+
+from recording import RecordingWriter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+STARTED = "Thu Jan  1 00:00:00 2026"
+PROMPT = "[s]tatus [p]ause [b]ypass [c]heckpoint [f]inish [q]uit => "
+WORDS = ["password", "dragon", "monkey", "shadow", "sunshine", "princess", "football", "charlie", "letmein", "trustno1"]
+
+
+def plaintext(rng):
+    return rng.choice(WORDS) + str(rng.randrange(10000))
+
+
+def ntlm_like(text):
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+def duration(seconds):
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return ", ".join(f"{value} {unit}" for value, unit in ((hours, "hours"), (minutes, "mins"), (seconds, "secs")) if value) or "0 secs"
+
+
+def status_screen(second, total_seconds, recovered, digests, temps, speeds):
+    keyspace = 14344385 * 77 * 16000
+    done = keyspace * second // total_seconds
+    words_done = 14344385 * 16000 * second // total_seconds
+    lines = [
+        "Session..........: hashcat",
+        "Status...........: Running",
+        "Hash.Mode........: 1000 (NTLM)",
+        "Hash.Target......: hashes.txt",
+        f"Time.Started.....: {STARTED} ({duration(second)})",
+        f"Time.Estimated...: {STARTED} ({duration(total_seconds - second)})",
+        "Kernel.Feature...: Pure Kernel",
+        "Guess.Base.......: File (combined.txt)",
+        "Guess.Mod........: Rules (best64.rule)",
+        "Guess.Queue......: 1/1 (100.00%)",
+    ]
+    for device, speed in enumerate(speeds, 1):
+        lines.append(f"Speed.#{device}.........: {speed / 1e6:8.1f} MH/s (52.11ms) @ Accel:512 Loops:77 Thr:256 Vec:1")
+    lines += [
+        f"Speed.#*.........: {sum(speeds) / 1e6:8.1f} MH/s",
+        f"Recovered........: {recovered}/{digests} ({recovered / digests * 100:.2f}%) Digests (total), {recovered}/{digests} ({recovered / digests * 100:.2f}%) Digests (new)",
+        f"Remaining........: {digests - recovered} ({(digests - recovered) / digests * 100:.2f}%) Digests",
+        f"Progress.........: {done}/{keyspace} ({done / keyspace * 100:.2f}%)",
+        f"Rejected.........: 0/{done} (0.00%)",
+        f"Restore.Point....: {words_done}/{14344385 * 16000} ({words_done / (14344385 * 16000) * 100:.2f}%)",
+    ]
+    for device in range(1, len(speeds) + 1):
+        lines += [f"Restore.Sub.#{device}...: Salt:0 Amplifier:0-77 Iteration:0-77", f"Candidates.#{device}....: {WORDS[device]}123 -> {WORDS[-device]}99"]
+    for device, temp in enumerate(temps, 1):
+        lines.append(f"Hardware.Mon.#{device}..: Temp: {temp}c Fan: {min(100, 30 + (temp - 50) * 2)}% Util: 99% Core:1905MHz Mem:9501MHz Bus:16")
+    return "\n" + "\n".join(lines) + "\n\n" + PROMPT
+
+
+def make_status_run(path, screens):
+    rng = random.Random(1)
+    writer = RecordingWriter(path, ["hashcat", "-m", "1000", "-a", "0", "--status", "--status-timer", "1", "hashes.txt", "combined.txt", "-r", "best64.rule"], recorded="synthetic")
+    writer.write(0.05, b"hashcat (v6.2.6) starting\n\nCUDA API (CUDA 12.2)\n====================\n* Device #1: NVIDIA GeForce RTX 4090, 23867/24563 MB, 128MCU\n* Device #2: NVIDIA GeForce RTX 4090, 23867/24563 MB, 128MCU\n\n")
+    digests, recovered = 50000, 0
+    for second in range(1, screens + 1):
+        # Temperatures climb to ~93c over the first half of the run and hover there, speeds sag when hot
+        temps = [min(93, 55 + second * 40 // max(screens // 2, 1)) + rng.randint(-2, 2) for _ in range(2)]
+        speeds = [int(8.1e9 * (0.85 if temp >= 88 else 1.0) * rng.uniform(0.98, 1.02)) for temp in temps]
+        cracked = [plaintext(rng) for _ in range(rng.choice((0, 0, 0, 1, 2, 5)))]
+        recovered += len(cracked)
+        if cracked: writer.write(second - 0.5, "".join(f"\n{ntlm_like(word)}:{word}" for word in cracked).encode() + b"\n")
+        writer.write(float(second), status_screen(second, screens, recovered, digests, temps, speeds).encode())
+    writer.write(screens + 0.2, f"\n\nSession..........: hashcat\nStatus...........: Exhausted\nStopped: {STARTED}\n".encode())
+    writer.close(1)
+
+
+def make_show_dump(path, lines):
+    rng = random.Random(2)
+    writer = RecordingWriter(path, ["hashcat", "-m", "1000", "--show", "hashes.txt"], recorded="synthetic")
+    buffer, t = b"", 0.0
+    for _ in range(lines):
+        word = plaintext(rng)
+        buffer += f"{ntlm_like(word + str(rng.random()))}:{word}\n".encode()
+        if len(buffer) >= 65536: t += 0.002; writer.write(t, buffer); buffer = b""
+    if buffer: writer.write(t + 0.002, buffer)
+    writer.close(0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--screens", type=int, default=3600, help="status screens in the status-timer run (one per second)")
+    parser.add_argument("--show-lines", type=int, default=20000, help="hash:plain lines in the --show dump")
+    parser.add_argument("--output-dir", default=FIXTURES_DIR)
+    args = parser.parse_args()
+    os.makedirs(args.output_dir, exist_ok=True)
+    make_status_run(os.path.join(args.output_dir, "status_timer_run.jsonl.gz"), args.screens)
+    make_show_dump(os.path.join(args.output_dir, "show_dump.jsonl.gz"), args.show_lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Record a real hashcat session's output with timing.
+
+    python bench/record_session.py -o session.jsonl.gz -- /path/to/hashcat -m 0 -a 0 --status --status-timer 1 hashes.txt words.txt
+
+hashcat's output is passed through to the terminal while it is recorded, and
+stdin stays attached so its interactive keys keep working.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from recording import RecordingWriter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", required=True, help="recording file (.jsonl or .jsonl.gz)")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="hashcat command line (after --)")
+    args = parser.parse_args()
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command: parser.error("no command given")
+
+    writer = RecordingWriter(args.output, command)
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=os.path.dirname(command[0]) or None)
+    started = time.monotonic()
+    try:
+        while chunk := os.read(process.stdout.fileno(), 65536):
+            writer.write(time.monotonic() - started, chunk)
+            sys.stdout.buffer.write(chunk); sys.stdout.flush()
+    except KeyboardInterrupt:
+        process.terminate()
+    exit_code = process.wait()
+    writer.close(exit_code)
+    print(f"\nRecorded {args.output} (exit code {exit_code})", file=sys.stderr)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
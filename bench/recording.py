@@ -0,0 +1,46 @@
+"""Read and write recordings of hashcat's output.
+
+A recording is a JSON-lines file, gzip-compressed when its name ends in ".gz":
+a header {"version": 1, "argv": [...], "recorded": "<ISO time>"}, one
+{"t": <seconds since start>, "data": <text>} line per chunk read from
+hashcat's stdout, and a footer {"exit": <exit code>}. Bytes that are not
+valid UTF-8 survive the round trip through surrogateescape.
+"""
+import gzip
+import json
+import time
+
+FORMAT_VERSION = 1
+
+
+def open_recording(path, mode):
+    if path.endswith(".gz"): return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class RecordingWriter:
+    def __init__(self, path, argv, recorded=None):
+        self._file = open_recording(path, "w")
+        self._write({"version": FORMAT_VERSION, "argv": list(argv), "recorded": recorded or time.strftime("%Y-%m-%dT%H:%M:%S%z")})
+
+    def _write(self, record): self._file.write(json.dumps(record) + "\n")
+
+    def write(self, t, data):
+        self._write({"t": round(t, 4), "data": data.decode("utf-8", errors="surrogateescape")})
+
+    def close(self, exit_code):
+        self._write({"exit": exit_code})
+        self._file.close()
+
+
+def read_recording(path):
+    """Return (header, [(t, bytes)], exit code)."""
+    header, chunks, exit_code = None, [], 0
+    with open_recording(path, "r") as f:
+        for line in f:
+            record = json.loads(line)
+            if header is None: header = record
+            elif "data" in record: chunks.append((record["t"], record["data"].encode("utf-8", errors="surrogateescape")))
+            elif "exit" in record: exit_code = record["exit"]
+    if not header or header.get("version") != FORMAT_VERSION: raise ValueError(f"{path}: not a version {FORMAT_VERSION} recording")
+    return header, chunks, exit_code
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Stand-in hashcat executable that replays a recording to stdout.
+
+    HASHCAT_REPLAY_FILE=bench/fixtures/status_timer_run.jsonl.gz HASHCAT_REPLAY_SPEED=1 bench/replay_stub.py ...
+
+Command-line arguments and interactive keys are ignored. HASHCAT_REPLAY_SPEED
+scales the recorded timing (2 = twice as fast); 0 writes everything as fast as
+the reader consumes it. The recorded exit code is returned, so the stub can be
+set as the GUI's hashcat executable to exercise the live status panel, the
+metrics exporter or the thermal governor with the fixtures' synthetic
+temperatures.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from recording import read_recording
+
+
+def main():
+    path = os.environ.get("HASHCAT_REPLAY_FILE")
+    if not path: print("HASHCAT_REPLAY_FILE is not set", file=sys.stderr); return 255
+    speed = float(os.environ.get("HASHCAT_REPLAY_SPEED", "1"))
+    _, chunks, exit_code = read_recording(path)
+    started = time.monotonic()
+    for t, data in chunks:
+        if speed > 0:
+            delay = t / speed - (time.monotonic() - started)
+            if delay > 0: time.sleep(delay)
+        sys.stdout.buffer.write(data); sys.stdout.flush()
+    return exit_code
+
+
+if __name__ == "__main__":
+    try: sys.exit(main())
+    except BrokenPipeError: sys.exit(1)
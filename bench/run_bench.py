@@ -0,0 +1,192 @@
+"""Benchmark the GUI's output and status hot paths by replaying recordings into a headless window.
+
+    python bench/run_bench.py                      # every fixture, replayed as fast as possible
+    python bench/run_bench.py --speed 1 --recording session.jsonl.gz --json results.json
+
+Each recording is fed through replay_stub.py into HashcatGUI via the normal
+QProcess path on the offscreen Qt platform, measuring:
+
+  event-loop latency   lateness of a 5 ms precise timer while output is handled (p50/p99/max)
+  CPU per MB           process CPU time spent per MB of hashcat output
+  memory growth        resident set size after the replay minus before
+  dropped updates      status screens in the recording that never reached the status panel
+                       because several arrived in the same read
+
+It also times display_command() and load_potfile_content() on a potfile built
+from the --show fixture. QSettings are redirected to a temporary directory and
+QStandardPaths is put in test mode, so the user's own settings and caches are
+not touched (on Windows the registry-backed settings still are). A replay that
+fails to start or runs past --timeout aborts the run with an error. Results are
+printed (and written to --json) as each benchmark finishes.
+
+Some PySide6 builds (seen with 6.12.0 on Python 3.11) drop a reference to None
+on every QLineEdit.setText(). The run then aborts with "Fatal Python error:
+none_dealloc" after a few thousand display_command() calls or at interpreter
+exit. The default --display-iterations of 500 stays below that; results already
+reported are unaffected.
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from PySide6.QtCore import QEventLoop, QProcess, QSettings, QStandardPaths, Qt, QTimer
+from PySide6.QtWidgets import QApplication
+
+import hashcat_gui
+from recording import read_recording
+
+STATUS_SCREEN_RE = re.compile(rb"^Status\.+: ", re.MULTILINE)
+
+
+def current_rss():
+    try:
+        with open("/proc/self/statm") as f: return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class LatencyProbe:
+    def __init__(self, interval_ms=5):
+        self.interval, self.samples, self._last = interval_ms / 1000, [], None
+        self.timer = QTimer(); self.timer.setTimerType(Qt.PreciseTimer); self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self._tick)
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last is not None: self.samples.append(max(0.0, now - self._last - self.interval) * 1000)
+        self._last = now
+
+    def start(self): self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        samples = sorted(self.samples) or [0.0]
+        return {"latency_p50_ms": statistics.median(samples), "latency_p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))], "latency_max_ms": samples[-1]}
+
+
+class StatusCounter:
+    """Counts status screens that reach the GUI by wrapping hashcat_gui.parse_status_text."""
+
+    def __init__(self):
+        self.rendered, self._parse = 0, hashcat_gui.parse_status_text
+
+    def __enter__(self):
+        def counting_parse(text):
+            status = self._parse(text)
+            if 'status' in status: self.rendered += 1
+            return status
+        hashcat_gui.parse_status_text = counting_parse
+        return self
+
+    def __exit__(self, *exc): hashcat_gui.parse_status_text = self._parse
+
+
+def replay(window, recording_path, speed, timeout):
+    _, chunks, _ = read_recording(recording_path)
+    output = b"".join(data for _, data in chunks)
+    os.environ["HASHCAT_REPLAY_FILE"], os.environ["HASHCAT_REPLAY_SPEED"] = recording_path, str(speed)
+    window.output_text.clear(); QApplication.processEvents()
+    loop, probe = QEventLoop(), LatencyProbe()
+    rss_before, cpu_before, wall_before = current_rss(), time.process_time(), time.perf_counter()
+    with StatusCounter() as counter:
+        probe.start()
+        window._start_process([sys.executable, os.path.join(BENCH_DIR, "replay_stub.py")])
+        process, timed_out = window.process, []
+        process.finished.connect(loop.quit); process.errorOccurred.connect(loop.quit)
+        def kill():
+            if process.state() != QProcess.NotRunning: timed_out.append(True); process.kill()
+            loop.quit()
+        QTimer.singleShot(int(timeout * 1000), loop, kill)
+        loop.exec()
+        QApplication.processEvents()
+        latency = probe.stop()
+    megabytes = len(output) / 1e6
+    recorded = len(STATUS_SCREEN_RE.findall(output))
+    if process.error() == QProcess.FailedToStart or timed_out:
+        raise RuntimeError(f"replay of {recording_path} " + ("timed out" if timed_out else f"failed to start: {process.errorString()}"))
+    return dict(latency, **{
+        "benchmark": f"replay {os.path.basename(recording_path)} @ {'max' if speed == 0 else f'{speed:g}x'}",
+        "wall_s": time.perf_counter() - wall_before,
+        "output_mb": megabytes,
+        "cpu_s_per_mb": (time.process_time() - cpu_before) / megabytes if megabytes else 0.0,
+        "rss_growth_mb": (current_rss() - rss_before) / 1e6,
+        "status_screens": recorded,
+        "status_updates": counter.rendered,
+        "dropped_updates": max(0, recorded - counter.rendered),
+    })
+
+
+def bench_display_command(window, iterations):
+    window.hash_file_input.setText("hashes.txt")
+    for field in window.input_fields: field.setText("?a?a?a?a?a?a" if field.property("is_mask") else "rockyou.txt")
+    started = time.perf_counter()
+    for _ in range(iterations): window.display_command()
+    return {"benchmark": "display_command", "calls": iterations, "per_call_us": (time.perf_counter() - started) / iterations * 1e6}
+
+
+def bench_load_potfile(window, show_recording, repeats, workdir):
+    _, chunks, _ = read_recording(show_recording)
+    potfile = os.path.join(workdir, "bench.potfile")
+    with open(potfile, "wb") as f:
+        for _, data in chunks: f.write(data)
+    window.potfile_viewer_path_input.setText(potfile)
+    rss_before, timings = current_rss(), []
+    for _ in range(repeats):
+        started = time.perf_counter(); window.load_potfile_content(); QApplication.processEvents()
+        timings.append(time.perf_counter() - started)
+    megabytes = os.path.getsize(potfile) / 1e6
+    return {"benchmark": f"load_potfile_content ({megabytes:.1f} MB)", "best_ms": min(timings) * 1000, "mean_ms": statistics.mean(timings) * 1000,
+            "mb_per_s": megabytes / min(timings), "rss_growth_mb": (current_rss() - rss_before) / 1e6}
+
+
+def format_result(result):
+    return "  ".join(f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}" for key, value in result.items() if key != "benchmark")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recording", action="append", help="recording to replay (repeatable, default: all fixtures)")
+    parser.add_argument("--speed", type=float, default=0, help="replay speed multiplier, 0 = as fast as possible (default)")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds before a replay is killed and reported as failed (default 600)")
+    parser.add_argument("--display-iterations", type=int, default=500)
+    parser.add_argument("--potfile-repeats", type=int, default=5)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    recordings = args.recording or sorted(glob.glob(os.path.join(BENCH_DIR, "fixtures", "*.jsonl*")))
+
+    workdir = tempfile.mkdtemp(prefix="hashcat_gui_bench_")
+    for settings_format in (QSettings.NativeFormat, QSettings.IniFormat): QSettings.setPath(settings_format, QSettings.UserScope, workdir)
+    QStandardPaths.setTestModeEnabled(True)
+    app = QApplication(sys.argv)
+    window = hashcat_gui.HashcatGUI()
+    window.path_input.setText(sys.executable)
+
+    results = []
+    def report(result):
+        # Report each result as soon as it is measured, so a later crash does not lose it
+        results.append(result)
+        print(f"{result['benchmark']}\n    {format_result(result)}", flush=True)
+        if args.json:
+            with open(args.json, "w") as f: json.dump(results, f, indent=2)
+
+    for path in recordings: report(replay(window, path, args.speed, args.timeout))
+    report(bench_display_command(window, args.display_iterations))
+    show_dump = os.path.join(BENCH_DIR, "fixtures", "show_dump.jsonl.gz")
+    if os.path.exists(show_dump): report(bench_load_potfile(window, show_dump, args.potfile_repeats, workdir))
+    window.close(); app.quit()
+
+
+if __name__ == "__main__":
+    main()
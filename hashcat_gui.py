@@ -5,15 +5,23 @@ import subprocess
 import re
 import platform
 import shlex
+import time
+import hashlib
+import secrets
+import random
+from collections import Counter
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QFileDialog,
     QTextEdit, QTabWidget, QSpinBox, QCheckBox, QFormLayout,
     QGroupBox, QScrollArea, QMessageBox, QCompleter, QDialog,
-    QListWidget, QListWidgetItem, QDialogButtonBox, QMenuBar, QProgressBar
+    QListWidget, QListWidgetItem, QDialogButtonBox, QMenuBar, QProgressBar,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QSettings, QProcess
+from PySide6.QtCore import Qt, QSettings, QProcess, QThread, Signal, QStandardPaths
 from PySide6.QtGui import QTextCursor, QAction, QActionGroup
 
 # =============================================================================
@@ -38,6 +46,16 @@ WORKLOAD_PROFILES = {
     "4 - Nightmare": 4,
 }
 
+# Brain Client Features (--brain-client-features)
+BRAIN_CLIENT_FEATURES = {
+    "1 - Send hashed passwords": 1,
+    "2 - Send attack positions": 2,
+    "3 - Send hashed passwords and attack positions": 3,
+}
+DEFAULT_BRAIN_PORT = 6863
+# Options whose values are masked wherever a command is shown, stored in the history or copied
+SECRET_OPTIONS = ('--brain-password',)
+
 # Hash modes that use specific parameters
 WPA_HASH_MODES = [2500, 2501, 22000, 22001]
 VERACRYPT_HASH_MODES = [13711, 13712, 13713, 13721, 13722, 13723, 13731, 13732, 13733, 13741, 13742, 13743, 13751, 13752, 13753, 13761, 13762, 13763]
@@ -159,11 +177,591 @@ THEMES = {
     """
 }
 
+# =============================================================================
+# Status Parsing & Metrics
+# =============================================================================
+
+# Matches "Key.Name........: value" lines of the hashcat status screen
+STATUS_LINE_RE = re.compile(r"^([A-Za-z][\w.#*]*?)\.*: (.*?)\s*$", re.MULTILINE)
+SPEED_RE = re.compile(r"([\d.]+)\s*([kMGTPE]?)H/s")
+SPEED_UNITS = {"": 1, "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18}
+PROGRESS_RE = re.compile(r"(\d+)/(\d+)\s*\(([\d.]+)%\)")
+HWMON_TEMP_RE = re.compile(r"Temp:\s*(-?\d+)c")
+HWMON_UTIL_RE = re.compile(r"Util:\s*(\d+)%")
+# Status keys of the form "done/total (percent%)"
+STATUS_COUNTER_KEYS = {"Progress": 'progress', "Recovered": 'recovered', "Restore.Point": 'restore_point', "Rejected": 'rejected'}
+
+def parse_status_text(text):
+    """Extract the fields of hashcat's status screen from a chunk of output. Returns {} when the chunk has none."""
+    status = {}
+    if ".: " not in text: return status
+    for key, value in STATUS_LINE_RE.findall(text):
+        if key == "Status": status['status'] = value
+        elif key == "Session": status['session'] = value
+        elif key == "Hash.Mode": status['hash_mode'] = value.split(" ", 1)[0]
+        elif key == "Time.Estimated": status['eta'] = value
+        elif key in STATUS_COUNTER_KEYS:
+            match = PROGRESS_RE.search(value)
+            if match: status[STATUS_COUNTER_KEYS[key]] = (int(match.group(1)), int(match.group(2)), float(match.group(3)))
+            # "Recovered: 5/9 (55.56%) Digests (total), 2/9 (22.22%) Digests (new)" - digests cracked by this run
+            if key == "Recovered" and "(new)" in value and (match := PROGRESS_RE.search(value, value.find("(total)") + 1)):
+                status['recovered_new'] = (int(match.group(1)), int(match.group(2)), float(match.group(3)))
+        elif key.startswith("Speed.") and "#" in key:
+            match = SPEED_RE.search(value)
+            if not match: continue
+            device = key.rsplit("#", 1)[1]
+            speed = float(match.group(1)) * SPEED_UNITS[match.group(2)]
+            if device == "*": status['speed_total'] = speed; status['speed_text'] = match.group(0)
+            else:
+                status.setdefault('speed', {})[device] = speed
+                status.setdefault('speed_text', match.group(0))
+        elif key.startswith("Hardware.Mon.#"):
+            device = key.rsplit("#", 1)[1]
+            temp_match, util_match = HWMON_TEMP_RE.search(value), HWMON_UTIL_RE.search(value)
+            if temp_match: status.setdefault('temp', {})[device] = int(temp_match.group(1))
+            if util_match: status.setdefault('util', {})[device] = int(util_match.group(1))
+    if 'speed' in status and 'speed_total' not in status: status['speed_total'] = sum(status['speed'].values())
+    return status
+
+def format_speed(hashes_per_second):
+    for unit in ("", "k", "M", "G", "T", "P"):
+        if hashes_per_second < 1000: break
+        hashes_per_second /= 1000
+    return f"{hashes_per_second:.1f} {unit}H/s"
+
+# Metric name -> (type, help text)
+METRIC_DEFINITIONS = {
+    "hashcat_running": ("gauge", "1 while a hashcat process is running."),
+    "hashcat_speed_hashes_per_second": ("gauge", "Combined cracking speed of all devices."),
+    "hashcat_device_speed_hashes_per_second": ("gauge", "Cracking speed per backend device."),
+    "hashcat_progress_ratio": ("gauge", "Fraction of the keyspace processed (0-1)."),
+    "hashcat_progress_candidates": ("gauge", "Candidates processed so far."),
+    "hashcat_keyspace_candidates": ("gauge", "Total candidates in the keyspace."),
+    "hashcat_recovered_digests": ("gauge", "Digests of the current hash list recovered so far, including those already in the potfile."),
+    "hashcat_rejected_candidates": ("gauge", "Candidates rejected in the current run (including those skipped by the brain)."),
+    "hashcat_digests": ("gauge", "Total digests loaded in the current run."),
+    "hashcat_device_temperature_celsius": ("gauge", "Device temperature reported by hashcat's hardware monitor."),
+    "hashcat_device_utilization_percent": ("gauge", "Device utilization reported by hashcat's hardware monitor."),
+    "hashcat_status_updates_total": ("counter", "Status screens parsed from hashcat output."),
+    "hashcat_cracked_total": ("counter", "Digests cracked by hashcat runs (potfile hits excluded)."),
+}
+
+def _format_labels(labels):
+    if not labels: return ""
+    escape = lambda value: str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels) + "}"
+
+class MetricsExporter:
+    """Holds the latest hashcat metrics and serves them in Prometheus text format on /metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+        self._last_recovered = {}
+        self._server = None
+
+    def is_running(self): return self._server is not None
+    def port(self): return self._server.server_address[1] if self._server else None
+
+    def start(self, port, host=""):
+        self.stop()
+        exporter = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics": self.send_error(404); return
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers(); self.wfile.write(body)
+            def log_message(self, *args): pass
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-exporter", daemon=True).start()
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown(); self._server.server_close(); self._server = None
+
+    def update_from_status(self, status, labels):
+        base = tuple(sorted(labels.items()))
+        values = {("hashcat_running", base): 1}
+        if 'speed_total' in status: values[("hashcat_speed_hashes_per_second", base)] = status['speed_total']
+        if 'progress' in status:
+            done, total, _ = status['progress']
+            values[("hashcat_progress_candidates", base)] = done
+            values[("hashcat_keyspace_candidates", base)] = total
+            values[("hashcat_progress_ratio", base)] = done / total if total else 0.0
+        if 'recovered' in status:
+            recovered, total, _ = status['recovered']
+            values[("hashcat_recovered_digests", base)] = recovered
+            values[("hashcat_digests", base)] = total
+        if 'rejected' in status: values[("hashcat_rejected_candidates", base)] = status['rejected'][0]
+        for key, name in (('speed', "hashcat_device_speed_hashes_per_second"), ('temp', "hashcat_device_temperature_celsius"), ('util', "hashcat_device_utilization_percent")):
+            for device, value in status.get(key, {}).items():
+                values[(name, tuple(sorted(labels.items() | {('device', device)})))] = value
+        with self._lock:
+            if 'status' in status: values[("hashcat_status_updates_total", base)] = self._values.get(("hashcat_status_updates_total", base), 0) + 1
+            if 'recovered' in status:
+                # Count digests cracked by this run: the "(new)" figure where hashcat prints it, otherwise the
+                # growth of the total since the run's first status screen (which already includes potfile hits)
+                cracked = status['recovered_new'][0] if 'recovered_new' in status else status['recovered'][0]
+                delta = cracked - self._last_recovered.get(base, 0 if 'recovered_new' in status else cracked)
+                self._last_recovered[base] = cracked
+                if delta > 0: values[("hashcat_cracked_total", base)] = self._values.get(("hashcat_cracked_total", base), 0) + delta
+            self._values.update(values)
+
+    def mark_finished(self, labels):
+        base = tuple(sorted(labels.items()))
+        with self._lock:
+            self._last_recovered.pop(base, None)
+            if ("hashcat_running", base) not in self._values: return
+            # Gauges describe a live run: drop this run's series (device ones included) and keep only its counters
+            for name, series in list(self._values):
+                if not name.endswith("_total") and tuple(label for label in series if label[0] != 'device') == base: del self._values[(name, series)]
+            self._values[("hashcat_running", base)] = 0
+
+    def render(self):
+        with self._lock: items = sorted(self._values.items())
+        lines, current = [], None
+        for (name, labels), value in items:
+            if name != current:
+                metric_type, help_text = METRIC_DEFINITIONS.get(name, ("gauge", ""))
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]; current = name
+            lines.append(f"{name}{_format_labels(labels)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+# =============================================================================
+# Thermal Governor
+# =============================================================================
+
+class ThermalGovernor:
+    """Watches device temperatures in status screens and throttles hashcat through its interactive keys.
+
+    send_key receives 'p' (pause), 'r' (resume) or 'c' (checkpoint quit); log receives a message per action.
+    With downshift enabled an overheating run is checkpointed instead of paused, and restart_workload tells
+    the caller which -w to relaunch with from restore_point.
+    """
+
+    def __init__(self, send_key, log, workload, pause_temp=90, resume_temp=80, downshift=False, clock=time.monotonic):
+        self.send_key, self.log, self.clock = send_key, log, clock
+        self.workload, self.pause_temp, self.resume_temp, self.downshift = workload, pause_temp, resume_temp, downshift
+        self.state = 'running'
+        self.restart_workload = None
+        self.restore_point = 0
+        self.started = None
+        self.candidates = 0
+        self.throttled_at = None
+        self.paused_since = None
+        self._last_done = None
+
+    def feed(self, status):
+        now = self.clock()
+        if self.started is None: self.started = now
+        if 'progress' in status:
+            done = status['progress'][0]
+            if self._last_done is not None and done > self._last_done: self.candidates += done - self._last_done
+            self._last_done = done
+        if 'restore_point' in status: self.restore_point = status['restore_point'][0]
+        temps = status.get('temp')
+        if not temps: return None
+        device = max(temps, key=temps.get); hottest = temps[device]
+        if self.state == 'running' and hottest >= self.pause_temp:
+            if self.throttled_at is None: self.throttled_at = (now, self.candidates)
+            if self.downshift and self.workload > 1:
+                self.state, self.restart_workload = 'checkpointing', self.workload - 1
+                self.send_key('c'); self.log(f"Device #{device} at {hottest}c (limit {self.pause_temp}c): checkpointing to restart with -w {self.restart_workload}")
+                return 'c'
+            self.state, self.paused_since = 'paused', now
+            self.send_key('p'); self.log(f"Device #{device} at {hottest}c (limit {self.pause_temp}c): pausing")
+            return 'p'
+        if self.state == 'paused' and hottest <= self.resume_temp:
+            self.state = 'running'
+            self.send_key('r'); self.log(f"Devices cooled to {hottest}c: resuming after {now - self.paused_since:.0f}s; {self.throughput_summary()}")
+            return 'r'
+        return None
+
+    def restarted(self):
+        self.state, self.workload, self.restart_workload = 'running', self.restart_workload, None
+        self._last_done = None
+
+    def throughput_summary(self):
+        if self.throttled_at is None: return "no throttling needed"
+        throttled_time, throttled_candidates = self.throttled_at
+        before = throttled_candidates / (throttled_time - self.started) if throttled_time > self.started else 0.0
+        elapsed = self.clock() - throttled_time
+        after = (self.candidates - throttled_candidates) / elapsed if elapsed > 0 else 0.0
+        change = f" ({(after - before) / before * 100:+.1f}%)" if before else ""
+        return f"effective throughput {format_speed(after)} since throttling vs {format_speed(before)} before{change}"
+
+# =============================================================================
+# Cracked Plaintext Feedback
+# =============================================================================
+
+def mask_secrets(command_list):
+    return [("********" if i > 0 and command_list[i - 1] in SECRET_OPTIONS else arg) for i, arg in enumerate(command_list)]
+
+def strip_options(command_list, valued=(), flags=()):
+    """Remove options (and the values of those in valued) from a command list, keeping the executable."""
+    result, skip_next = command_list[:1], False
+    for arg in command_list[1:]:
+        if skip_next: skip_next = False; continue
+        if arg in valued: skip_next = True; continue
+        if arg not in flags: result.append(arg)
+    return result
+
+def read_new_plaintexts(potfile_path, offset):
+    """Return the plaintexts of potfile lines appended after byte offset, and the offset to continue from."""
+    if not os.path.exists(potfile_path): return [], offset
+    if os.path.getsize(potfile_path) < offset: offset = 0  # potfile was rewritten
+    with open(potfile_path, 'rb') as f: f.seek(offset); data = f.read()
+    complete = data[:data.rfind(b"\n") + 1]
+    # Plaintexts containing ':' are $HEX[]-encoded by hashcat, so the last separator is unambiguous
+    plaintexts = [line.rstrip(b"\r").rsplit(b":", 1)[1] for line in complete.split(b"\n") if b":" in line]
+    return plaintexts, offset + len(complete)
+
+def append_to_derived_wordlist(path, plaintexts):
+    """Append plaintexts that the wordlist does not contain yet.
+
+    Returns (physical lines before appending, lines added); the former is what hashcat's -s counts, so
+    duplicate and blank lines already in the file are included.
+    """
+    existing, lines_before, needs_newline = set(), 0, False
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            for line in f: existing.add(line.rstrip(b"\r\n")); lines_before += 1; needs_newline = not line.endswith(b"\n")
+    new = []
+    for plaintext in plaintexts:
+        if plaintext and plaintext not in existing: existing.add(plaintext); new.append(plaintext)
+    if new:
+        with open(path, 'ab') as f: f.write((b"\n" if needs_newline else b"") + b"".join(plaintext + b"\n" for plaintext in new))
+    return lines_before, len(new)
+
+# =============================================================================
+# Hash Identification
+# =============================================================================
+
+EXAMPLE_MODE_RE = re.compile(r"^(?:Hash mode #|MODE: )(\d+)\s*$")
+EXAMPLE_HASH_RE = re.compile(r"^\s*(?:Example\.Hash\.*|HASH): (.+?)\s*$")
+EXAMPLE_FORMAT_RE = re.compile(r"^\s*Example\.Hash\.Format\.*: (\w+)")
+# A literal scheme prefix such as "$2y$" or "{SSHA}"; leading words like usernames are ordinary segments
+HASH_PREFIX_RE = re.compile(r"^(\$[^$]*\$|\{[^}]*\})")
+# Optional crypt() cost field, e.g. "$6$rounds=5000$salt$hash"
+HASH_ROUNDS_RE = re.compile(r"^rounds=\d+\$")
+# A "*...*" group containing separators is one free-text field, e.g. "*user$realm$host/spn:port*" in Kerberos hashes
+HASH_OPAQUE_GROUP_RE = re.compile(r"\*[^*]*[:$][^*]*\*")
+# Prefix variants hashcat accepts under a single mode
+HASH_PREFIX_ALIASES = {"$2b$": "$2a$", "$2x$": "$2a$", "$2y$": "$2a$"}
+HASH_SEPARATOR_RE = re.compile(r"([:$*])")
+HEX_SEGMENT_RE = re.compile(r"[0-9a-fA-F]*")
+BASE64_SEGMENT_RE = re.compile(r"[\w+/=.-]*")
+# Example segments at least this long are treated as digests whose charset must match; shorter ones
+# (usernames, domains, salts, iteration counts) only need to be present at the same position
+MIN_HEX_DIGEST_LENGTH = 16
+MIN_BASE64_DIGEST_LENGTH = 20
+MIN_MATCH_SCORE = 0.75
+MIN_IDENTIFIED_SHARE = 0.5
+HASH_SAMPLE_FULL_READ = 1024 * 1024
+
+def hash_shape(line):
+    """Describe a hash line as (prefix, separators, segment classes, segment lengths)."""
+    match = HASH_PREFIX_RE.match(line)
+    prefix = match.group(0) if match else ""
+    rest = line[len(prefix):]
+    if match := HASH_ROUNDS_RE.match(rest): rest = rest[match.end():]
+    rest = HASH_OPAQUE_GROUP_RE.sub("*_*", rest)
+    parts = HASH_SEPARATOR_RE.split(rest)
+    prefix = HASH_PREFIX_ALIASES.get(prefix, prefix)
+    segments = parts[0::2]
+    classes = tuple('h' if HEX_SEGMENT_RE.fullmatch(segment) else 'b' if BASE64_SEGMENT_RE.fullmatch(segment) else 'x' for segment in segments)
+    return prefix, "".join(parts[1::2]), classes, tuple(len(segment) for segment in segments)
+
+def sample_hash_lines(path, sample_size=1000, strip_username=False):
+    """Read all lines of small hash files, or the head plus random lines of large ones."""
+    with open(path, 'rb') as f:
+        if os.path.getsize(path) <= HASH_SAMPLE_FULL_READ: raw_lines = f.read().splitlines()
+        else:
+            raw_lines = [f.readline() for _ in range(sample_size // 10)]
+            size, rng = os.path.getsize(path), random.Random(os.path.getsize(path))
+            for offset in sorted(rng.randrange(size) for _ in range(sample_size - len(raw_lines))):
+                f.seek(offset); f.readline(); raw_lines.append(f.readline())
+    lines = []
+    for raw_line in raw_lines:
+        line = raw_line.decode('utf-8', errors='ignore').strip()
+        if strip_username and ":" in line: line = line.split(":", 1)[1]
+        if line: lines.append(line)
+    return lines
+
+class HashIdentifier:
+    """Ranks hash modes for hash lines by comparing their shape with hashcat's example hashes."""
+
+    def __init__(self, examples):
+        self.examples = examples
+        self._index = {}
+        self._shape_cache = {}
+        for mode, example in examples.items():
+            prefix, separators, classes, lengths = hash_shape(example)
+            constraints = tuple(cls if (cls == 'h' and length >= MIN_HEX_DIGEST_LENGTH) or (cls == 'b' and length >= MIN_BASE64_DIGEST_LENGTH) else None
+                                for cls, length in zip(classes, lengths))
+            self._index.setdefault((prefix, separators), []).append((mode, constraints, lengths))
+
+    @staticmethod
+    def parse_example_hashes(text):
+        examples, mode, plain_format = {}, None, True
+        for line in text.splitlines():
+            if match := EXAMPLE_MODE_RE.match(line): mode, plain_format = int(match.group(1)), True
+            elif match := EXAMPLE_FORMAT_RE.match(line): plain_format = match.group(1) == "plain"
+            elif (match := EXAMPLE_HASH_RE.match(line)) and mode is not None and plain_format and not match.group(1).startswith("["):
+                examples[mode] = match.group(1)
+        return examples
+
+    def candidates(self, line):
+        shape = hash_shape(line)
+        if shape not in self._shape_cache:
+            prefix, separators, classes, lengths = shape
+            scored = []
+            for mode, constraints, mode_lengths in self._index.get((prefix, separators), []):
+                if any(constraint == 'h' and cls != 'h' or constraint == 'b' and cls == 'x' for cls, constraint in zip(classes, constraints)): continue
+                # Score on the digest segments; modes without any fall back to comparing every segment length
+                positions = [i for i, constraint in enumerate(constraints) if constraint] or range(len(constraints))
+                score = 0.5 + 0.5 * sum(lengths[i] == mode_lengths[i] for i in positions) / len(positions)
+                if score >= MIN_MATCH_SCORE: scored.append((mode, score))
+            scored.sort(key=lambda item: (-item[1], item[0]))
+            self._shape_cache[shape] = scored
+        return self._shape_cache[shape]
+
+    def best_mode(self, line):
+        scored = self.candidates(line)
+        return scored[0][0] if scored else None
+
+    def identify(self, lines, limit=20):
+        """Return ([(mode, share of lines matched, mean score)], Counter of best mode per line)."""
+        matched, scores, groups = Counter(), Counter(), Counter()
+        for line in lines:
+            scored = self.candidates(line)
+            groups[scored[0][0] if scored else None] += 1
+            for mode, score in scored: matched[mode] += 1; scores[mode] += score
+        total = len(lines) or 1
+        ranked = sorted(((mode, count / total, scores[mode] / count) for mode, count in matched.items()), key=lambda item: (-item[1], -item[2], item[0]))
+        return ranked[:limit], groups
+
+def split_hash_file(identifier, path, strip_username=False):
+    """Write the lines of a mixed hash file to one file per detected mode. Returns {mode or None: (path, count)}."""
+    base, ext = os.path.splitext(path)
+    outputs, counts = {}, Counter()
+    try:
+        with open(path, 'rb') as f:
+            for raw_line in f:
+                line = raw_line.decode('utf-8', errors='ignore').strip()
+                if not line: continue
+                mode = identifier.best_mode(line.split(":", 1)[1] if strip_username and ":" in line else line)
+                if mode not in outputs: outputs[mode] = open(f"{base}.m{mode}{ext}" if mode is not None else f"{base}.unidentified{ext}", 'wb')
+                outputs[mode].write(raw_line if raw_line.endswith(b"\n") else raw_line + b"\n"); counts[mode] += 1
+    finally:
+        for output in outputs.values(): output.close()
+    return {mode: (output.name, counts[mode]) for mode, output in outputs.items()}
+
+# =============================================================================
+# Wordlist & Rules Catalogue
+# =============================================================================
+
+RULE_FILE_EXTENSIONS = ('.rule', '.rules')
+CATALOGUE_READ_SIZE = 4 * 1024 * 1024
+
+# Built-in mask charset sizes (?l, ?u, ...)
+MASK_CHARSET_SIZES = {'l': 26, 'u': 26, 'd': 10, 'h': 16, 'H': 16, 's': 33, 'a': 95, 'b': 256}
+
+def scan_catalogue_file(path, should_stop=lambda: False):
+    """Read a file once to get its line count, average line length and a content fingerprint. Returns None if interrupted."""
+    digest = hashlib.blake2b(digest_size=16)
+    lines = line_bytes = 0
+    last_byte = b"\n"
+    with open(path, 'rb') as f:
+        while chunk := f.read(CATALOGUE_READ_SIZE):
+            if should_stop(): return None
+            digest.update(chunk)
+            newlines = chunk.count(b"\n")
+            lines += newlines; line_bytes += len(chunk) - newlines - chunk.count(b"\r")
+            last_byte = chunk[-1:]
+    if last_byte != b"\n": lines += 1
+    return {'lines': lines, 'avg_length': round(line_bytes / lines, 2) if lines else 0.0, 'fingerprint': digest.hexdigest()}
+
+def format_size(num_bytes):
+    for unit in ("B", "KB", "MB", "GB"):
+        if num_bytes < 1024: return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+def charset_size(charset):
+    size, i = 0, 0
+    while i < len(charset):
+        if charset[i] == '?' and i + 1 < len(charset):
+            size += MASK_CHARSET_SIZES.get(charset[i + 1], 1); i += 2
+        else: size += 1; i += 1
+    return size
+
+def mask_keyspace(mask, custom_charsets=None):
+    custom_sizes = {key: charset_size(value) for key, value in (custom_charsets or {}).items() if value}
+    keyspace, i = 1, 0
+    while i < len(mask):
+        if mask[i] == '?' and i + 1 < len(mask):
+            token = mask[i + 1]
+            keyspace *= MASK_CHARSET_SIZES.get(token) or custom_sizes.get(token) or 1; i += 2
+        else: i += 1
+    return keyspace
+
+class WordlistCatalogue:
+    """Cached metadata (size, lines, average length, fingerprint) of wordlists and rule files, keyed by path."""
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.entries = {}
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f: self.entries = json.load(f)
+        except (OSError, ValueError): pass
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f: json.dump(self.entries, f)
+        except OSError: pass
+
+    def lookup(self, path):
+        entry = self.entries.get(os.path.abspath(path))
+        if not entry: return None
+        try: stat = os.stat(path)
+        except OSError: return None
+        return entry if entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size else None
+
+    def line_count(self, path):
+        if os.path.isdir(path):
+            prefix = os.path.join(os.path.abspath(path), "")
+            counts = [entry['lines'] for file_path, entry in self.entries.items() if file_path.startswith(prefix) and entry['kind'] == 'wordlist']
+            return sum(counts) if counts else None
+        entry = self.lookup(path)
+        return entry['lines'] if entry else None
+
+    def duplicates(self):
+        by_fingerprint = {}
+        for path in sorted(self.entries): by_fingerprint.setdefault(self.entries[path]['fingerprint'], []).append(path)
+        return {path: paths[0] for paths in by_fingerprint.values() if len(paths) > 1 for path in paths[1:]}
+
+class CatalogueIndexer(QThread):
+    file_indexed = Signal(str, dict)
+    indexing_done = Signal(list)
+
+    def __init__(self, directories, cached_entries, parent=None):
+        super().__init__(parent)
+        self.directories, self.cached_entries = list(directories), dict(cached_entries)
+
+    def run(self):
+        seen = []
+        for directory in self.directories:
+            for root, _, files in os.walk(directory):
+                for name in sorted(files):
+                    if self.isInterruptionRequested(): return
+                    path = os.path.abspath(os.path.join(root, name))
+                    try: stat = os.stat(path)
+                    except OSError: continue
+                    seen.append(path)
+                    cached = self.cached_entries.get(path)
+                    if cached and cached['mtime'] == stat.st_mtime and cached['size'] == stat.st_size: continue
+                    try: scan = scan_catalogue_file(path, self.isInterruptionRequested)
+                    except OSError: continue
+                    if scan is None: return
+                    kind = 'rule' if name.lower().endswith(RULE_FILE_EXTENSIONS) else 'wordlist'
+                    self.file_indexed.emit(path, dict(scan, mtime=stat.st_mtime, size=stat.st_size, kind=kind))
+        self.indexing_done.emit(seen)
+
+class _SortableItem(QTableWidgetItem):
+    def __lt__(self, other):
+        mine, theirs = self.data(Qt.UserRole), other.data(Qt.UserRole)
+        if mine is None or theirs is None: return self.text() < other.text()
+        return mine < theirs
+
+class WordlistCatalogueDialog(QDialog):
+    COLUMNS = ["Name", "Size", "Lines", "Avg. Length", "Same Content As", "Directory"]
+
+    def __init__(self, gui, kind=None):
+        super().__init__(gui)
+        self.gui, self.kind, self.selected_path = gui, kind, None
+        self.setWindowTitle("Rules Catalogue" if kind == 'rule' else "Wordlist Catalogue"); self.resize(900, 500)
+        layout = QVBoxLayout(self)
+        dirs_layout = QHBoxLayout()
+        self.dirs_list = QListWidget(); self.dirs_list.setMaximumHeight(70); self.dirs_list.addItems(gui.catalogue_directories())
+        add_dir_button = QPushButton("Add Directory..."); add_dir_button.clicked.connect(self.add_directory)
+        remove_dir_button = QPushButton("Remove"); remove_dir_button.clicked.connect(self.remove_directory)
+        rescan_button = QPushButton("Rescan"); rescan_button.clicked.connect(gui.start_catalogue_indexing)
+        dir_buttons = QVBoxLayout(); dir_buttons.addWidget(add_dir_button); dir_buttons.addWidget(remove_dir_button); dir_buttons.addWidget(rescan_button)
+        dirs_layout.addWidget(self.dirs_list, 1); dirs_layout.addLayout(dir_buttons)
+        layout.addWidget(QLabel("Indexed directories:")); layout.addLayout(dirs_layout)
+        self.search_input = QLineEdit(); self.search_input.setPlaceholderText("Filter by name or path..."); self.search_input.textChanged.connect(self.apply_filter)
+        layout.addWidget(self.search_input)
+        self.table = QTableWidget(0, len(self.COLUMNS)); self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers); self.table.setSelectionBehavior(QAbstractItemView.SelectRows); self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch); self.table.verticalHeader().setVisible(False)
+        self.table.doubleClicked.connect(self.accept)
+        layout.addWidget(self.table, 1)
+        self.status_label = QLabel(); layout.addWidget(self.status_label)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel); buttons.accepted.connect(self.accept); buttons.rejected.connect(self.reject); layout.addWidget(buttons)
+        gui.catalogue_updated.connect(self.populate)
+        self.populate()
+
+    def populate(self):
+        entries = self.gui.catalogue.entries
+        duplicates = self.gui.catalogue.duplicates()
+        current_row = self.table.currentRow()
+        current_path = self.table.item(current_row, 0).data(Qt.UserRole + 1) if current_row >= 0 else None
+        self.table.setSortingEnabled(False); self.table.setRowCount(0)
+        for path, entry in sorted(entries.items()):
+            if self.kind and entry['kind'] != self.kind: continue
+            row = self.table.rowCount(); self.table.insertRow(row)
+            values = [(os.path.basename(path), None), (format_size(entry['size']), entry['size']), (f"{entry['lines']:,}", entry['lines']),
+                      (f"{entry['avg_length']:.1f}", entry['avg_length']), (os.path.basename(duplicates.get(path, "")), None), (os.path.dirname(path), None)]
+            for column, (text, sort_key) in enumerate(values):
+                item = _SortableItem(text); item.setData(Qt.UserRole, sort_key); item.setToolTip(path); self.table.setItem(row, column, item)
+            self.table.item(row, 0).setData(Qt.UserRole + 1, path)
+        self.table.setSortingEnabled(True)
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).data(Qt.UserRole + 1) == current_path: self.table.selectRow(row)
+        indexing = self.gui.catalogue_indexer is not None and self.gui.catalogue_indexer.isRunning()
+        self.status_label.setText(f"{self.table.rowCount()} files" + (" (indexing in background...)" if indexing else ""))
+        self.apply_filter(self.search_input.text())
+
+    def apply_filter(self, text):
+        needle = text.lower()
+        for row in range(self.table.rowCount()):
+            path = self.table.item(row, 0).data(Qt.UserRole + 1)
+            self.table.setRowHidden(row, bool(needle) and needle not in path.lower())
+
+    def add_directory(self):
+        dir_path = QFileDialog.getExistingDirectory(self, "Add Catalogue Directory", dir=self.gui.settings.value("lastBrowseDir", ""))
+        if dir_path and dir_path not in self.gui.catalogue_directories():
+            self.dirs_list.addItem(dir_path); self.gui.set_catalogue_directories(self._directories())
+
+    def remove_directory(self):
+        row = self.dirs_list.currentRow()
+        if row >= 0: self.dirs_list.takeItem(row); self.gui.set_catalogue_directories(self._directories())
+
+    def _directories(self): return [self.dirs_list.item(i).text() for i in range(self.dirs_list.count())]
+
+    def accept(self):
+        row = self.table.currentRow()
+        if row >= 0: self.selected_path = self.table.item(row, 0).data(Qt.UserRole + 1)
+        self.gui.catalogue_updated.disconnect(self.populate)
+        super().accept()
+
+    def reject(self):
+        self.gui.catalogue_updated.disconnect(self.populate)
+        super().reject()
+
 # =============================================================================
 # Main Application Class
 # =============================================================================
 
 class HashcatGUI(QMainWindow):
+    catalogue_updated = Signal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Hashcat GUI v2.3.1")
@@ -176,6 +774,17 @@ class HashcatGUI(QMainWindow):
         self.MAX_HISTORY_ITEMS = 20
         self.settings = QSettings("MyCompany", "HashcatGUI_v2.3")
         self.process = None
+        self.metrics = MetricsExporter()
+        self.metrics_labels = {}
+        self._output_tail = ""
+        self.governor = None
+        self.feedback = None
+        self.last_command_list = None
+        self.run_status = {}
+        self.brain_process = None
+        self.hash_identifier = None
+        self.catalogue = WordlistCatalogue(self._app_data_path("wordlist_catalogue.json"))
+        self.catalogue_indexer = None
 
         # --- UI Initialization ---
         self._create_menu_bar()
@@ -196,6 +805,11 @@ class HashcatGUI(QMainWindow):
         self._load_theme()
         self.update_contextual_widgets()
         self.display_command()
+        self.update_metrics_exporter()
+        self.start_catalogue_indexing()
+
+    def _app_data_path(self, filename):
+        return os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), filename)
 
     # -------------------------------------------------------------------------
     # UI Creation Methods
@@ -208,6 +822,8 @@ class HashcatGUI(QMainWindow):
         load_action = QAction("&Load Profile...", self); load_action.triggered.connect(self.load_settings_dialog); file_menu.addAction(load_action)
         file_menu.addSeparator()
         exit_action = QAction("&Exit", self); exit_action.triggered.connect(self.close); file_menu.addAction(exit_action)
+        tools_menu = menu_bar.addMenu("&Tools")
+        catalogue_action = QAction("Wordlist &Catalogue...", self); catalogue_action.triggered.connect(lambda: self.open_catalogue_picker()); tools_menu.addAction(catalogue_action)
         view_menu = menu_bar.addMenu("&View")
         theme_menu = view_menu.addMenu("&Themes")
         self.theme_action_group = QActionGroup(self); self.theme_action_group.setExclusive(True)
@@ -236,8 +852,8 @@ class HashcatGUI(QMainWindow):
         tab_configs = {
             "Basic Attack": "_create_basic_tab_content", "Performance/Hardware": "_create_performance_tab_content",
             "Output/Session": "_create_output_tab_content", "Rules": "_create_rules_tab_content",
-            "Mask/Charsets": "_create_mask_tab_content", "Advanced/Misc": "_create_advanced_tab_content",
-            "Potfile Viewer": "_create_potfile_tab_content"
+            "Mask/Charsets": "_create_mask_tab_content", "Brain": "_create_brain_tab_content",
+            "Advanced/Misc": "_create_advanced_tab_content", "Potfile Viewer": "_create_potfile_tab_content"
         }
         for name, method_name in tab_configs.items():
             scroll_area = self._create_scrollable_tab()
@@ -279,8 +895,10 @@ class HashcatGUI(QMainWindow):
         self.status_label_recovered = QLabel("N/A")
         self.status_label_speed = QLabel("N/A")
         self.status_label_eta = QLabel("N/A")
+        self.status_label_rejected = QLabel("N/A")
         status_layout.addRow("Progress:", self.progress_bar)
         status_layout.addRow("Recovered:", self.status_label_recovered)
+        status_layout.addRow("Rejected:", self.status_label_rejected)
         status_layout.addRow("Total Speed:", self.status_label_speed)
         status_layout.addRow("Time Estimated:", self.status_label_eta)
         self.status_group.setVisible(False)
@@ -308,7 +926,7 @@ class HashcatGUI(QMainWindow):
         hash_file_layout.addWidget(self.hash_file_input)
         self.hash_file_button = QPushButton("Browse..."); self.hash_file_button.clicked.connect(lambda: self.browse_file(self.hash_file_input, "Select Hash File"))
         hash_file_layout.addWidget(self.hash_file_button)
-        self.identify_hash_button = QPushButton("Identify Type"); self.identify_hash_button.setToolTip("Run 'hashcat --identify'"); self.identify_hash_button.clicked.connect(self.identify_hash_type)
+        self.identify_hash_button = QPushButton("Identify Type"); self.identify_hash_button.setToolTip("Match sampled lines against hashcat's example hash signatures"); self.identify_hash_button.clicked.connect(self.identify_hash_type)
         hash_file_layout.addWidget(self.identify_hash_button)
         form_layout.addRow("Hash File/HCCAPX:", hash_file_layout)
         self.hash_type_combo = QComboBox(); self.hash_type_combo.setEditable(True); self.hash_type_combo.setInsertPolicy(QComboBox.NoInsert)
@@ -321,6 +939,8 @@ class HashcatGUI(QMainWindow):
         self.input_group = QGroupBox("Input Arguments"); self.input_layout = QVBoxLayout()
         self.input_fields = []; self.input_group.setLayout(self.input_layout)
         form_layout.addRow(self.input_group); self.controls['input_fields'] = self.input_fields
+        self.keyspace_label = QLabel("N/A"); self.keyspace_label.setToolTip("Based on line counts from the wordlist catalogue")
+        form_layout.addRow("Keyspace Estimate:", self.keyspace_label)
         layout.addLayout(form_layout)
         self.attack_mode_combo.currentIndexChanged.connect(self.update_input_fields)
         self.update_input_fields()
@@ -338,6 +958,15 @@ class HashcatGUI(QMainWindow):
         self.controls['kernel_accel'] = self._add_form_widget(form_layout, "Kernel Accel (-n):", QSpinBox(minimum=0, maximum=1024), tooltip="Manual workload tuning, outerloop step size (0=auto)")
         self.controls['kernel_loops'] = self._add_form_widget(form_layout, "Kernel Loops (-u):", QSpinBox(minimum=0, maximum=1024), tooltip="Manual workload tuning, innerloop step size (0=auto)")
         layout.addLayout(form_layout)
+        governor_group = QGroupBox("Thermal Governor"); governor_layout = QFormLayout(governor_group)
+        self.controls['governor_enabled'] = self._add_form_widget(governor_layout, "Enable:", QCheckBox("Throttle hashcat when a device gets too hot (requires --status)"))
+        self.controls['governor_pause_temp'] = self._add_form_widget(governor_layout, "Throttle At (°C):", QSpinBox(minimum=40, maximum=120, value=90))
+        self.controls['governor_resume_temp'] = self._add_form_widget(governor_layout, "Resume Below (°C):", QSpinBox(minimum=30, maximum=115, value=80))
+        self.controls['governor_downshift'] = self._add_form_widget(governor_layout, "Downshift:", QCheckBox("Checkpoint and restart with a lower -w instead of pausing"))
+        # Resuming at or above the throttle temperature would pause and resume on every status screen
+        pause_temp, resume_temp = self.controls['governor_pause_temp'], self.controls['governor_resume_temp']
+        pause_temp.valueChanged.connect(lambda value: resume_temp.setMaximum(value - 1)); resume_temp.setMaximum(pause_temp.value() - 1)
+        layout.addWidget(governor_group)
 
     def _create_output_tab_content(self, layout):
         form_layout = QFormLayout()
@@ -349,10 +978,18 @@ class HashcatGUI(QMainWindow):
         self.controls['session_name'] = self._add_form_widget(form_layout, "Session Name (--session):", QLineEdit())
         self.controls['restore_session'] = self._add_form_widget(form_layout, "Restore Session (--restore):", QCheckBox("Restore session specified by --session"))
         layout.addLayout(form_layout)
+        feedback_group = QGroupBox("Cracked Plaintext Feedback"); feedback_layout = QFormLayout(feedback_group)
+        self.controls['feedback_enabled'] = self._add_form_widget(feedback_layout, "Enable:", QCheckBox("Feed new plaintexts into follow-up attacks after each run"), tooltip="Adds --potfile-path with the Potfile Viewer's potfile")
+        self.controls['feedback_wordlist'] = self._add_form_widget(feedback_layout, "Derived Wordlist:", QLineEdit(), browse_type='save', placeholder="Default: <hash file>.derived.txt")
+        self.controls['feedback_rules'] = self._add_form_widget(feedback_layout, "Follow-up Rules (-r):", QLineEdit(), browse_type='open', catalogue_kind='rule', placeholder="Default: rules file of the Rules tab")
+        self.controls['feedback_loopback'] = self._add_form_widget(feedback_layout, "Loopback (--loopback):", QCheckBox("Add plaintexts cracked during follow-up runs to the candidates"))
+        self.controls['feedback_min_cracks'] = self._add_form_widget(feedback_layout, "Min. New Cracks/Round:", QSpinBox(minimum=1, maximum=1000000, value=1), tooltip="Stop looping when a round recovers fewer plaintexts")
+        self.controls['feedback_max_rounds'] = self._add_form_widget(feedback_layout, "Max. Follow-up Rounds:", QSpinBox(minimum=1, maximum=100, value=5))
+        layout.addWidget(feedback_group)
 
     def _create_rules_tab_content(self, layout):
         form_layout = QFormLayout()
-        self.controls['rules_file'] = self._add_form_widget(form_layout, "Rules File (-r):", QLineEdit(), browse_type='open')
+        self.controls['rules_file'] = self._add_form_widget(form_layout, "Rules File (-r):", QLineEdit(), browse_type='open', catalogue_kind='rule')
         self.controls['generate_rules'] = self._add_form_widget(form_layout, "Generate Rules (-g):", QSpinBox(minimum=0, maximum=100000), tooltip="Generate X random rules (0=disable)")
         layout.addLayout(form_layout)
 
@@ -368,6 +1005,23 @@ class HashcatGUI(QMainWindow):
         self.controls['increment'].toggled.connect(self.controls['increment_max'].setEnabled)
         layout.addLayout(form_layout)
 
+    def _create_brain_tab_content(self, layout):
+        client_group = QGroupBox("Brain Client"); form_layout = QFormLayout(client_group)
+        self.controls['brain_client'] = self._add_form_widget(form_layout, "Brain Client (--brain-client):", QCheckBox("Skip candidates the brain server has already seen"))
+        self.controls['brain_host'] = self._add_form_widget(form_layout, "Brain Host (--brain-host):", QLineEdit(), placeholder="127.0.0.1")
+        self.controls['brain_port'] = self._add_form_widget(form_layout, "Brain Port (--brain-port):", QSpinBox(minimum=1, maximum=65535, value=DEFAULT_BRAIN_PORT))
+        self.controls['brain_password'] = self._add_form_widget(form_layout, "Brain Password (--brain-password):", QLineEdit())
+        self.controls['brain_password'].setEchoMode(QLineEdit.PasswordEchoOnEdit)
+        self.controls['brain_password'].setToolTip("Shown as ******** in the generated command, history and clipboard; saved in plain text in profiles")
+        self.controls['brain_client_features'] = self._add_form_widget(form_layout, "Client Features:", QComboBox(), combo_items=BRAIN_CLIENT_FEATURES, combo_default="Default")
+        self.controls['brain_session_whitelist'] = self._add_form_widget(form_layout, "Session Whitelist:", QLineEdit(), placeholder="e.g., 0x1a2b3c4d,0x5e6f7a8b", tooltip="Allow only these brain sessions (--brain-session-whitelist)")
+        layout.addWidget(client_group)
+        server_group = QGroupBox("Local Brain Server"); server_layout = QHBoxLayout(server_group)
+        self.brain_server_label = QLabel("Stopped")
+        self.brain_server_button = QPushButton("Start Brain Server"); self.brain_server_button.clicked.connect(self.toggle_brain_server)
+        server_layout.addWidget(QLabel("Status:")); server_layout.addWidget(self.brain_server_label, 1); server_layout.addWidget(self.brain_server_button)
+        layout.addWidget(server_group)
+
     def _create_advanced_tab_content(self, layout):
         form_layout = QFormLayout()
         self.controls['force'] = self._add_form_widget(form_layout, "Force (--force):", QCheckBox("Ignore warnings"))
@@ -378,6 +1032,10 @@ class HashcatGUI(QMainWindow):
         self.controls['hccapx_message_pair_widget'] = self._add_form_widget(form_layout, "HCCAPX Message Pair:", QSpinBox(minimum=0, maximum=10), tooltip="Load only message pairs from hccapx matching X (0=all)")
         self.controls['veracrypt_pim_start_widget'] = self._add_form_widget(form_layout, "VeraCrypt PIM Start:", QSpinBox(minimum=0, maximum=5000))
         self.controls['veracrypt_pim_stop_widget'] = self._add_form_widget(form_layout, "VeraCrypt PIM Stop:", QSpinBox(minimum=0, maximum=5000))
+        self.controls['metrics_enabled'] = self._add_form_widget(form_layout, "Metrics Exporter:", QCheckBox("Serve Prometheus/OpenMetrics metrics on /metrics"), tooltip="Requires --status for live values")
+        self.controls['metrics_port'] = self._add_form_widget(form_layout, "Metrics Port:", QSpinBox(minimum=1, maximum=65535, value=9101))
+        self.controls['metrics_enabled'].toggled.connect(self.update_metrics_exporter)
+        self.controls['metrics_port'].editingFinished.connect(self.update_metrics_exporter)
         layout.addLayout(form_layout)
 
     def _create_potfile_tab_content(self, layout):
@@ -411,7 +1069,11 @@ class HashcatGUI(QMainWindow):
             if browse_type == 'open': browse_button.clicked.connect(lambda: self.browse_file(widget, f"Select {label}"))
             elif browse_type == 'save': browse_button.clicked.connect(lambda: self.browse_save_file(widget, f"Select {label}"))
             elif browse_type == 'dir': browse_button.clicked.connect(lambda: self.browse_directory(widget, f"Select {label}"))
-            row_layout.addWidget(browse_button); form_layout.addRow(label, row_layout)
+            row_layout.addWidget(browse_button)
+            if 'catalogue_kind' in kwargs:
+                catalogue_button = QPushButton("Catalogue..."); catalogue_button.clicked.connect(lambda: self.open_catalogue_picker(widget, kwargs['catalogue_kind']))
+                row_layout.addWidget(catalogue_button)
+            form_layout.addRow(label, row_layout)
         else:
             form_layout.addRow(label, widget)
         return widget
@@ -440,6 +1102,7 @@ class HashcatGUI(QMainWindow):
         except Exception as e:
             if not silent_on_error: QMessageBox.warning(self, "Execution Error", f"Failed to run hashcat -hh: {e}")
             return
+        self.hash_identifier = None
         parsed_modes = {}
         try:
             modes_text_match = re.search(r"^- \[ Hash Modes \] -$(.*?)^\s*- \[", help_text, re.MULTILINE | re.DOTALL)
@@ -475,8 +1138,106 @@ class HashcatGUI(QMainWindow):
         self.controls['veracrypt_pim_stop_widget'].setEnabled(is_veracrypt)
         self.display_command()
 
+    def toggle_brain_server(self):
+        if self.brain_process and self.brain_process.state() != QProcess.NotRunning: self.stop_brain_server(); return
+        if not self._pre_run_checks(): return
+        if not self.controls['brain_password'].text().strip(): self.controls['brain_password'].setText(secrets.token_hex(16))
+        host = self.controls['brain_host'].text().strip() or "127.0.0.1"
+        port = str(self.controls['brain_port'].value())
+        command_list = [self.path_input.text().strip(), '--brain-server', '--brain-host', host, '--brain-port', port, '--brain-password', self.controls['brain_password'].text().strip()]
+        self.brain_process = QProcess(self)
+        self.brain_process.setProcessChannelMode(QProcess.MergedChannels)
+        self.brain_process.setWorkingDirectory(os.path.dirname(command_list[0]))
+        self.brain_process.readyReadStandardOutput.connect(lambda: self.output_text.append("[brain] " + bytes(self.brain_process.readAllStandardOutput()).decode(errors='ignore').rstrip()))
+        self.brain_process.finished.connect(self._brain_server_finished)
+        self.brain_process.errorOccurred.connect(self._brain_server_error)
+        self.brain_server_label.setText(f"Running on {host}:{port}"); self.brain_server_button.setText("Stop Brain Server")
+        self.output_text.append(f"\n--- Brain server starting on {host}:{port} ---")
+        self.brain_process.start(command_list[0], command_list[1:])
+
+    def stop_brain_server(self):
+        process = self.brain_process
+        if process and process.state() != QProcess.NotRunning:
+            process.terminate()
+            if not process.waitForFinished(2000): process.kill(); process.waitForFinished(1000)
+
+    def _brain_server_error(self, error):
+        self.output_text.append(f"\n--- Brain Server Error: {self.brain_process.errorString()} ---")
+        # A process that fails to start never emits finished
+        if error == QProcess.FailedToStart:
+            self.brain_server_label.setText("Stopped"); self.brain_server_button.setText("Start Brain Server")
+            self.brain_process.deleteLater(); self.brain_process = None
+
+    def _brain_server_finished(self, exit_code=0, exit_status=QProcess.NormalExit):
+        self.output_text.append(f"\n--- Brain server stopped (Code: {exit_code}) ---")
+        self.brain_server_label.setText("Stopped"); self.brain_server_button.setText("Start Brain Server")
+        if self.brain_process: self.brain_process.deleteLater()
+        self.brain_process = None
+
+    def update_metrics_exporter(self):
+        enabled, port = self.controls['metrics_enabled'].isChecked(), self.controls['metrics_port'].value()
+        if not enabled: self.metrics.stop(); return
+        if self.metrics.port() == port: return
+        try:
+            self.metrics.start(port)
+            self.output_text.append(f"\nMetrics exporter listening on port {port} (/metrics)")
+        except OSError as e:
+            QMessageBox.warning(self, "Metrics Exporter", f"Could not listen on port {port}: {e}")
+            self.controls['metrics_enabled'].setChecked(False)
+
+    def _get_hash_identifier(self):
+        if self.hash_identifier is not None: return self.hash_identifier
+        hashcat_path = self.path_input.text().strip()
+        cache_path = self._app_data_path("hash_signatures.json")
+        mtime = os.path.getmtime(hashcat_path)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f: cache = json.load(f)
+            if cache['hashcat'] == hashcat_path and cache['mtime'] == mtime:
+                self.hash_identifier = HashIdentifier({int(mode): example for mode, example in cache['examples'].items()})
+                return self.hash_identifier
+        except (OSError, ValueError, KeyError): pass
+        self.output_text.append("\n--- Building hash signature index from 'hashcat --example-hashes' (once per hashcat version) ---")
+        QApplication.processEvents()
+        try:
+            process_result = subprocess.run([hashcat_path, '--example-hashes'], capture_output=True, text=True, encoding='utf-8', errors='ignore', check=False, timeout=120, cwd=os.path.dirname(hashcat_path) or None)
+        except Exception as e:
+            self.output_text.append(f"Failed to run hashcat --example-hashes: {e}"); return None
+        examples = HashIdentifier.parse_example_hashes(process_result.stdout)
+        if not examples: return None
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f: json.dump({'hashcat': hashcat_path, 'mtime': mtime, 'examples': examples}, f)
+        except OSError: pass
+        self.hash_identifier = HashIdentifier(examples)
+        return self.hash_identifier
+
     def identify_hash_type(self):
         if not self._pre_run_checks(check_hash_file_only=True): return
+        identifier = self._get_hash_identifier()
+        if identifier is None: self._identify_with_hashcat(); return
+        hash_file, strip_username = self.hash_file_input.text().strip(), self.controls['username'].isChecked()
+        started = time.perf_counter()
+        try: lines = sample_hash_lines(hash_file, strip_username=strip_username)
+        except OSError as e: QMessageBox.critical(self, "Error", f"Could not read the hash file: {e}"); return
+        ranked, groups = identifier.identify(lines)
+        self.output_text.append(f"\nIdentified {len(lines)} sampled lines in {(time.perf_counter() - started) * 1000:.1f} ms")
+        if not ranked or ranked[0][1] < MIN_IDENTIFIED_SHARE:
+            self.output_text.append("No confident local match, asking hashcat instead.")
+            self._identify_with_hashcat(); return
+        names = {code: name for name, code in self.HASH_MODES.items()}
+        suggestions = [(mode, f"{names.get(mode, f'{mode} | (not listed by hashcat -hh)')}  [{share:.0%} of lines]") for mode, share, _ in ranked]
+        detected = [mode for mode in groups if mode is not None]
+        split = (lambda: self.split_hash_file_by_mode(identifier, hash_file, strip_username)) if len(detected) > 1 or (detected and None in groups) else None
+        self._show_hash_suggestion_dialog(suggestions, split)
+
+    def split_hash_file_by_mode(self, identifier, hash_file, strip_username=False):
+        try: outputs = split_hash_file(identifier, hash_file, strip_username)
+        except OSError as e: QMessageBox.critical(self, "Error", f"Could not split the hash file: {e}"); return
+        summary = "\n".join(f"{'unidentified' if mode is None else f'-m {mode}'}: {count} lines -> {path}" for mode, (path, count) in sorted(outputs.items(), key=lambda item: -item[1][1]))
+        self.output_text.append(f"\n--- Split {hash_file} by detected mode ---\n{summary}")
+        QMessageBox.information(self, "Split Hash File", summary)
+
+    def _identify_with_hashcat(self):
         self.output_text.append(f"\n--- Running 'hashcat --identify' ---\n")
         QApplication.processEvents()
         try:
@@ -485,20 +1246,24 @@ class HashcatGUI(QMainWindow):
             self.output_text.append(output)
             possible_section = re.search(r"Possible Hash-Modes:\n(?:-+\n)?(.*?)(?=\n\n|\n\s*---)", output, re.DOTALL | re.IGNORECASE)
             if possible_section:
-                identified_modes = {code: dn for match in re.finditer(r"^\s*(\d+)\s*\|", possible_section.group(1), re.MULTILINE) if (code := int(match.group(1))) and (dn := next((d for d, c in self.HASH_MODES.items() if c == code), None))}
+                names = {code: name for name, code in self.HASH_MODES.items()}
+                identified_modes = sorted({code: names[code] for match in re.finditer(r"^\s*(\d+)\s*\|", possible_section.group(1), re.MULTILINE) if (code := int(match.group(1))) in names}.items())
                 if identified_modes: self._show_hash_suggestion_dialog(identified_modes)
                 else: QMessageBox.information(self, "Identify Type", "No matching hash types found in your version of Hashcat.")
             else: QMessageBox.information(self, "Identify Type", "Could not identify any hash types.")
         except Exception as e: QMessageBox.critical(self, "Error", f"An error occurred: {e}")
 
-    def _show_hash_suggestion_dialog(self, identified_modes):
+    def _show_hash_suggestion_dialog(self, identified_modes, split_callback=None):
         dialog = QDialog(self); dialog.setWindowTitle("Suggested Hash Types")
         layout = QVBoxLayout(dialog); list_widget = QListWidget()
-        for code, display_name in sorted(identified_modes.items()):
+        for code, display_name in identified_modes:
             item = QListWidgetItem(display_name); item.setData(Qt.UserRole, code); list_widget.addItem(item)
         if list_widget.count() > 0: list_widget.setCurrentRow(0)
         layout.addWidget(QLabel("Select a hash type:")); layout.addWidget(list_widget)
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel); buttons.accepted.connect(dialog.accept); buttons.rejected.connect(dialog.reject); layout.addWidget(buttons)
+        if split_callback:
+            layout.insertWidget(0, QLabel("The file appears to contain several hash types."))
+            split_button = buttons.addButton("Split File by Mode...", QDialogButtonBox.ActionRole); split_button.clicked.connect(split_callback)
         if dialog.exec() and list_widget.currentItem():
             index = self.hash_type_combo.findData(list_widget.currentItem().data(Qt.UserRole))
             if index != -1: self.hash_type_combo.setCurrentIndex(index)
@@ -547,7 +1312,7 @@ class HashcatGUI(QMainWindow):
         current_mode = self.controls['hash_type'].currentData()
         for name, widget in self.controls.items():
             if name in ['hash_type', 'attack_mode', 'hash_file', 'input_fields', 'potfile_viewer_path', 'autocopy']: continue
-            flag_map = {'workload': '-w', 'optimized_kernels': '-O', 'backend_devices': '-d', 'kernel_accel': '-n', 'kernel_loops': '-u', 'outfile': '-o', 'outfile_format_input': '--outfile-format', 'show_cracked': '--show', 'show_uncracked': '--left', 'remove_cracked': '--remove', 'session_name': '--session', 'restore_session': '--restore', 'rules_file': '-r', 'generate_rules': '-g', 'custom_charset1': '-1', 'custom_charset2': '-2', 'increment': '-i', 'increment_min': '--increment-min', 'increment_max': '--increment-max', 'force': '--force', 'status': '--status', 'status_timer': '--status-timer', 'username': '--username', 'runtime': '--runtime', 'hccapx_message_pair_widget': '--hccapx-message-pair', 'veracrypt_pim_start_widget': '--veracrypt-pim-start', 'veracrypt_pim_stop_widget': '--veracrypt-pim-stop'}
+            flag_map = {'workload': '-w', 'optimized_kernels': '-O', 'backend_devices': '-d', 'kernel_accel': '-n', 'kernel_loops': '-u', 'outfile': '-o', 'outfile_format_input': '--outfile-format', 'show_cracked': '--show', 'show_uncracked': '--left', 'remove_cracked': '--remove', 'session_name': '--session', 'restore_session': '--restore', 'rules_file': '-r', 'generate_rules': '-g', 'custom_charset1': '-1', 'custom_charset2': '-2', 'increment': '-i', 'increment_min': '--increment-min', 'increment_max': '--increment-max', 'force': '--force', 'status': '--status', 'status_timer': '--status-timer', 'username': '--username', 'runtime': '--runtime', 'hccapx_message_pair_widget': '--hccapx-message-pair', 'veracrypt_pim_start_widget': '--veracrypt-pim-start', 'veracrypt_pim_stop_widget': '--veracrypt-pim-stop', 'brain_client': '--brain-client', 'brain_host': '--brain-host', 'brain_port': '--brain-port', 'brain_password': '--brain-password', 'brain_client_features': '--brain-client-features', 'brain_session_whitelist': '--brain-session-whitelist'}
             if name in flag_map:
                 flag, value, is_bool = flag_map[name], None, isinstance(widget, QCheckBox)
                 if is_bool: value = widget.isChecked()
@@ -557,9 +1322,13 @@ class HashcatGUI(QMainWindow):
                 if name == 'hccapx_message_pair_widget' and current_mode not in WPA_HASH_MODES: continue
                 if name.startswith('veracrypt_pim') and current_mode not in VERACRYPT_HASH_MODES: continue
                 if name.startswith('increment_') and not self.controls.get('increment', QCheckBox()).isChecked(): continue
+                if name.startswith('brain_') and name != 'brain_client' and not self.controls.get('brain_client', QCheckBox()).isChecked(): continue
                 
                 if value is not None: add_arg(flag, value, is_bool)
         
+        # The feedback loop reads new plaintexts from the viewer's potfile, so hashcat has to write to it
+        if self.controls.get('feedback_enabled', QCheckBox()).isChecked() and self.potfile_viewer_path_input.text().strip():
+            add_arg('--potfile-path', os.path.abspath(self.potfile_viewer_path_input.text().strip()))
         hash_file = self.controls.get('hash_file', QLineEdit()).text().strip()
         if not hash_file: return None
         cmd_list.append(hash_file)
@@ -570,12 +1339,69 @@ class HashcatGUI(QMainWindow):
     def display_command(self):
         command_list = self.build_command_list()
         if command_list:
-            full_command_str = shlex.join(command_list)
+            full_command_str = shlex.join(mask_secrets(command_list))
             self.command_output_display.setText(full_command_str)
             if self.controls.get('autocopy', QCheckBox()).isChecked():
                 QApplication.clipboard().setText(full_command_str)
         else:
             self.command_output_display.setText("[Error generating command - check required fields]")
+        self.update_keyspace_estimate()
+
+    def update_keyspace_estimate(self):
+        if 'custom_charset2' not in self.controls: return
+        custom_charsets = {'1': self.controls['custom_charset1'].text(), '2': self.controls['custom_charset2'].text()}
+        keyspace = 1
+        for field in self.input_fields:
+            text = field.text().strip()
+            if not text: self.keyspace_label.setText("N/A"); return
+            if field.property("is_mask"): keyspace *= mask_keyspace(text, custom_charsets); continue
+            line_count = self.catalogue.line_count(text)
+            if line_count is None: self.keyspace_label.setText("Unknown (wordlist not in catalogue)"); return
+            keyspace *= line_count
+        if not self.input_fields: self.keyspace_label.setText("N/A"); return
+        if self.controls['attack_mode'].currentData() == 0:
+            rules_file = self.controls['rules_file'].text().strip()
+            if rules_file:
+                rule_count = self.catalogue.line_count(rules_file)
+                if rule_count is None: self.keyspace_label.setText("Unknown (rules file not in catalogue)"); return
+                keyspace *= max(rule_count, 1)
+            elif self.controls['generate_rules'].value(): keyspace *= self.controls['generate_rules'].value()
+        self.keyspace_label.setText(f"~{keyspace:,} candidates")
+
+    def catalogue_directories(self): return self.settings.value("catalogueDirs", [], type=list)
+
+    def set_catalogue_directories(self, directories):
+        self.settings.setValue("catalogueDirs", directories)
+        self.start_catalogue_indexing(restart=True)
+
+    def start_catalogue_indexing(self, restart=False):
+        if self.catalogue_indexer is not None:
+            if not restart: return
+            self.catalogue_indexer.requestInterruption(); self.catalogue_indexer.wait()
+        self.catalogue_indexer = CatalogueIndexer(self.catalogue_directories(), self.catalogue.entries, self)
+        self.catalogue_indexer.file_indexed.connect(self._on_catalogue_file_indexed)
+        self.catalogue_indexer.indexing_done.connect(self._on_catalogue_indexing_done)
+        self.catalogue_indexer.finished.connect(self._on_catalogue_indexer_finished)
+        self.catalogue_indexer.start(QThread.LowPriority)
+
+    def _on_catalogue_file_indexed(self, path, entry):
+        self.catalogue.entries[path] = entry
+        self.catalogue_updated.emit(); self.update_keyspace_estimate()
+
+    def _on_catalogue_indexing_done(self, seen_paths):
+        seen = set(seen_paths)
+        self.catalogue.entries = {path: entry for path, entry in self.catalogue.entries.items() if path in seen}
+        self.catalogue.save()
+
+    def _on_catalogue_indexer_finished(self):
+        indexer = self.sender()
+        if indexer is self.catalogue_indexer: self.catalogue_indexer = None
+        if indexer is not None: indexer.deleteLater()
+        self.catalogue_updated.emit(); self.update_keyspace_estimate()
+
+    def open_catalogue_picker(self, line_edit=None, kind=None):
+        dialog = WordlistCatalogueDialog(self, kind)
+        if dialog.exec() and line_edit is not None and dialog.selected_path: line_edit.setText(dialog.selected_path)
 
     def _add_to_history(self):
         full_command_str = self.command_output_display.text()
@@ -598,10 +1424,19 @@ class HashcatGUI(QMainWindow):
                 QMessageBox.warning(self, "Error", f"Hash file not found or not specified: {hash_file}"); return False
         return True
 
-    def _start_process(self, command_list):
+    def _start_process(self, command_list, clear_output=True):
         if self.process and self.process.state() == QProcess.Running:
             QMessageBox.warning(self, "Warning", "A process is already running."); return
-        self.output_text.clear(); QApplication.processEvents()
+        if clear_output: self.output_text.clear()
+        QApplication.processEvents()
+        self._output_tail = ""
+        self.last_command_list = command_list
+        self.run_status = {'started': time.monotonic()}
+        self.metrics_labels = {
+            'session': self.controls['session_name'].text().strip() or "hashcat",
+            'hash_mode': str(self.controls['hash_type'].currentData()),
+            'attack_mode': str(self.controls['attack_mode'].currentData()),
+        }
         self.process = QProcess()
         self.process.setProcessChannelMode(QProcess.MergedChannels)
         self.process.readyReadStandardOutput.connect(self.handle_output)
@@ -611,34 +1446,99 @@ class HashcatGUI(QMainWindow):
             self.process.setWorkingDirectory(os.path.dirname(command_list[0]))
             self.process.start(command_list[0], command_list[1:])
             self.set_running_state(True)
-            self.output_text.append(f"Starting: {shlex.join(command_list)}\n---\n")
+            self.output_text.append(f"Starting: {shlex.join(mask_secrets(command_list))}\n---\n")
         except Exception as e:
             self.output_text.append(f"\n--- Failed to start process: {e} ---")
             self.set_running_state(False)
 
     def run_hashcat(self):
         if not self._pre_run_checks(check_hash_file_only=True): return
+        if self.controls['feedback_enabled'].isChecked() and not self.potfile_viewer_path_input.text().strip():
+            QMessageBox.warning(self, "Error", "The feedback loop reads cracked plaintexts from the Potfile Viewer's potfile: set its path first."); return
         self.display_command()
         command_list = self.build_command_list()
         if not command_list:
             self.output_text.setText("Cannot run: Command generation failed."); return
         self._add_to_history()
+        self.governor = self._create_governor(command_list)
+        self.feedback = self._create_feedback_state(command_list)
         self._start_process(command_list)
 
+    def _create_feedback_state(self, command_list):
+        if not self.controls['feedback_enabled'].isChecked() or self.controls['show_cracked'].isChecked() or self.controls['show_uncracked'].isChecked(): return None
+        potfile_path = os.path.abspath(self.potfile_viewer_path_input.text().strip())
+        hash_file = self.hash_file_input.text().strip()
+        return {
+            'round': 0, 'base_command': command_list, 'potfile': potfile_path,
+            'offset': os.path.getsize(potfile_path) if os.path.exists(potfile_path) else 0,
+            'input_count': sum(1 for field in self.input_fields if field.text().strip()),
+            'wordlist': self.controls['feedback_wordlist'].text().strip() or f"{hash_file}.derived.txt",
+            'rules': self.controls['feedback_rules'].text().strip() or self.controls['rules_file'].text().strip(),
+        }
+
+    def _run_feedback_stage(self, exit_code):
+        feedback, self.feedback = self.feedback, None
+        try:
+            plaintexts, feedback['offset'] = read_new_plaintexts(feedback['potfile'], feedback['offset'])
+            lines_before, added = append_to_derived_wordlist(feedback['wordlist'], plaintexts)
+        except OSError as e:
+            self.output_text.append(f"\n--- Feedback: could not update derived wordlist: {e} ---"); return
+        self.output_text.append(f"\n--- Feedback round {feedback['round']}: {len(plaintexts)} new plaintexts, {added} added to {feedback['wordlist']} ({lines_before + added} total) ---")
+        # hashcat exits with 1 when the keyspace is exhausted; 0 means every hash is cracked
+        if exit_code != 1: return
+        if len(plaintexts) < self.controls['feedback_min_cracks'].value() or added == 0:
+            self.output_text.append("--- Feedback: crack rate below threshold, stopping ---"); return
+        if feedback['round'] >= self.controls['feedback_max_rounds'].value():
+            self.output_text.append("--- Feedback: maximum number of rounds reached, stopping ---"); return
+        feedback['round'] += 1
+        base = feedback['base_command'][:len(feedback['base_command']) - feedback['input_count']]
+        hash_file = base.pop()
+        command_list = strip_options(base, valued=('-a', '-r', '-s', '-g', '-1', '-2', '--increment-min', '--increment-max'), flags=('-i', '--loopback', '--restore'))
+        command_list += ['-a', '0', '-s', str(lines_before)]
+        if feedback['rules']: command_list += ['-r', feedback['rules']]
+        if self.controls['feedback_loopback'].isChecked(): command_list.append('--loopback')
+        command_list += [hash_file, feedback['wordlist']]
+        self.output_text.append(f"--- Feedback: starting follow-up round {feedback['round']} ---")
+        self.feedback = feedback
+        self.governor = self._create_governor(command_list)
+        self._start_process(command_list, clear_output=False)
+
+    def _create_governor(self, command_list):
+        if not self.controls['governor_enabled'].isChecked(): return None
+        if not self.controls['status'].isChecked(): self.output_text.append("\n--- Thermal governor needs --status to see device temperatures ---")
+        downshift = self.controls['governor_downshift'].isChecked()
+        # hashcat refuses -s together with --increment, so an increment run can only be paused
+        if downshift and ('-i' in command_list or '--increment' in command_list):
+            downshift = False; self.output_text.append("\n--- Thermal governor: downshift is not possible with --increment, pausing instead ---")
+        return ThermalGovernor(
+            lambda key: self.process.write(key.encode()) if self.process else None,
+            lambda message: self.output_text.append(f"\n--- Governor: {message} ---"),
+            self.controls['workload'].currentData() or 2,
+            pause_temp=self.controls['governor_pause_temp'].value(), resume_temp=self.controls['governor_resume_temp'].value(),
+            downshift=downshift)
+
+    def _restart_with_lower_workload(self):
+        command_list = strip_options(self.last_command_list, valued=('-w', '-s'), flags=('--restore',))
+        command_list[1:1] = ['-w', str(self.governor.restart_workload), '-s', str(self.governor.restore_point)]
+        self.governor.restarted()
+        self._start_process(command_list, clear_output=False)
+
     def run_benchmark(self):
         if not self._pre_run_checks(): return
+        self.governor = self.feedback = None
         self._start_process([self.path_input.text().strip(), '--benchmark'])
     
     def list_devices(self):
         if not self._pre_run_checks(): return
+        self.governor = self.feedback = None
         self._start_process([self.path_input.text().strip(), '-I'])
 
     def run_in_terminal(self):
         if not self._pre_run_checks(check_hash_file_only=True): return
         self.display_command(); command_list = self.build_command_list()
         if not command_list: QMessageBox.warning(self, "Error", "Command generation failed."); return
-        self._add_to_history(); final_command = self.command_output_display.text()
-        self.output_text.append(f"\nAttempting to run in new terminal:\n{final_command}\n")
+        self._add_to_history(); final_command = shlex.join(command_list)
+        self.output_text.append(f"\nAttempting to run in new terminal:\n{self.command_output_display.text()}\n")
         try:
             cmd, cwd = "", os.path.dirname(command_list[0])
             if platform.system() == "Windows": cmd = f'start "Hashcat" cmd /k "cd /d {shlex.quote(cwd)} && {final_command}"'
@@ -653,6 +1553,8 @@ class HashcatGUI(QMainWindow):
         except Exception as e: QMessageBox.critical(self, "Error", f"Failed to open terminal: {e}")
 
     def stop_hashcat(self):
+        self.governor = None
+        self.feedback = None
         if self.process and self.process.state() == QProcess.Running:
             self.output_text.append("\n--- Sending termination signal ---")
             self.process.terminate()
@@ -664,21 +1566,34 @@ class HashcatGUI(QMainWindow):
         if not self.process: return
         text = bytes(self.process.readAllStandardOutput()).decode(errors='ignore')
         self.output_text.moveCursor(QTextCursor.End); self.output_text.insertPlainText(text); self.output_text.moveCursor(QTextCursor.End)
-        status_match = re.search(r"^Status.*?: (.*?)\s*$", text, re.MULTILINE)
-        if status_match and status_match.group(1) == "Running": self.status_group.setVisible(True)
-        progress_match = re.search(r"^Progress.*?\(([\d.]+)%\)", text, re.MULTILINE)
-        if progress_match: self.progress_bar.setValue(int(float(progress_match.group(1))))
-        recovered_match = re.search(r"^Recovered.*?: (\d+/\d+)", text, re.MULTILINE)
-        if recovered_match: self.status_label_recovered.setText(recovered_match.group(1))
-        speed_match = re.search(r"^Speed.*?: (.*) ", text, re.MULTILINE)
-        if speed_match: self.status_label_speed.setText(speed_match.group(1).strip())
-        eta_match = re.search(r"^Time.Estimated.*?: (.*) ", text, re.MULTILINE)
-        if eta_match: self.status_label_eta.setText(eta_match.group(1).strip())
+        # Only parse complete lines; a status screen may be split across reads
+        complete, _, self._output_tail = (self._output_tail + text).rpartition("\n")
+        status = parse_status_text(complete)
+        if not status: return
+        self.run_status.update(status)
+        if status.get('status') == "Running": self.status_group.setVisible(True)
+        if 'progress' in status: self.progress_bar.setValue(int(status['progress'][2]))
+        if 'recovered' in status: self.status_label_recovered.setText(f"{status['recovered'][0]}/{status['recovered'][1]}")
+        if 'speed_text' in status: self.status_label_speed.setText(status['speed_text'])
+        if 'eta' in status: self.status_label_eta.setText(status['eta'])
+        if 'rejected' in status: self.status_label_rejected.setText(f"{status['rejected'][0]:,}/{status['rejected'][1]:,} ({status['rejected'][2]:.2f}%)")
+        if self.metrics.is_running(): self.metrics.update_from_status(status, self.metrics_labels)
+        if self.governor: self.governor.feed(status)
 
     def process_finished(self, exit_code=0, exit_status=QProcess.NormalExit):
         status_text = "Finished" if exit_status == QProcess.NormalExit else "Crashed"
         self.output_text.append(f"\n--- Process {status_text} (Code: {exit_code}) ---")
+        if self.last_command_list and '--brain-client' in self.last_command_list and 'rejected' in self.run_status:
+            rejected, total, percent = self.run_status['rejected']
+            self.output_text.append(f"--- Brain: {rejected:,} of {total:,} candidates rejected ({percent:.2f}%) in {time.monotonic() - self.run_status['started']:.0f}s ---")
+        self.metrics.mark_finished(self.metrics_labels)
         self.set_running_state(False)
+        if self.governor:
+            # hashcat exits with 3 when aborted by a checkpoint
+            if self.governor.restart_workload and exit_code == 3: self._restart_with_lower_workload(); return
+            self.output_text.append(f"\n--- Governor: {self.governor.throughput_summary()} ---")
+            self.governor = None
+        if self.feedback: self._run_feedback_stage(exit_code)
 
     def process_error(self, error):
         self.output_text.append(f"\n--- Process Error: {self.process.errorString()} ---")
@@ -704,6 +1619,11 @@ class HashcatGUI(QMainWindow):
             elif reply == QMessageBox.No: event.accept()
             else: event.ignore()
         else: event.accept()
+        if event.isAccepted():
+            self.metrics.stop()
+            self.stop_brain_server()
+            if self.catalogue_indexer is not None: self.catalogue_indexer.requestInterruption(); self.catalogue_indexer.wait()
+            self.catalogue.save()
 
     def get_settings_dict(self):
         settings_data = {'hashcat_executable_path': self.path_input.text()}
@@ -720,6 +1640,8 @@ class HashcatGUI(QMainWindow):
         self._parse_and_populate_hash_modes(silent_on_error=True)
         for name, widget in self.controls.items():
             value = settings_data.get(name)
+            # Profiles saved by older versions lack the newer controls; keep their defaults
+            if value is None and not isinstance(widget, QComboBox): continue
             try:
                 if isinstance(widget, QLineEdit): widget.setText(str(value))
                 elif isinstance(widget, QCheckBox): widget.setChecked(bool(value))
@@ -734,6 +1656,7 @@ class HashcatGUI(QMainWindow):
                 if i < len(self.controls['input_fields']): self.controls['input_fields'][i].setText(str(field_val))
         self.update_contextual_widgets()
         self.display_command()
+        self.update_metrics_exporter()
 
     def save_settings_dialog(self):
         session_name = self.controls.get('session_name', QLineEdit()).text().strip()
@@ -777,11 +1700,12 @@ class HashcatGUI(QMainWindow):
         field_configs = {0: [("Wordlist/Directory:", False)], 1: [("Left Wordlist/Directory:", False), ("Right Wordlist/Directory:", False)], 3: [("Mask:", True)], 6: [("Wordlist/Directory:", False), ("Mask:", True)], 7: [("Mask:", True), ("Wordlist/Directory:", False)], 9: [("Base Wordlist/Directory:", False)]}.get(attack_mode_code, [])
         form_layout = QFormLayout()
         for label, is_mask in field_configs:
-            input_widget = QLineEdit(); input_widget.textChanged.connect(self.display_command); self.input_fields.append(input_widget)
+            input_widget = QLineEdit(); input_widget.textChanged.connect(self.display_command); input_widget.setProperty("is_mask", is_mask); self.input_fields.append(input_widget)
             if is_mask: form_layout.addRow(label, input_widget)
             else:
                 browse_button = QPushButton("..."); browse_button.setFixedWidth(30); browse_button.clicked.connect(lambda c, lw=input_widget: self.browse_file_or_dir(lw))
-                row = QHBoxLayout(); row.addWidget(input_widget); row.addWidget(browse_button); form_layout.addRow(label, row)
+                catalogue_button = QPushButton("Catalogue..."); catalogue_button.clicked.connect(lambda c, lw=input_widget: self.open_catalogue_picker(lw, 'wordlist'))
+                row = QHBoxLayout(); row.addWidget(input_widget); row.addWidget(browse_button); row.addWidget(catalogue_button); form_layout.addRow(label, row)
         self.input_layout.addLayout(form_layout)
 
     def browse_file(self, line_edit, caption="Select File"):
@@ -806,6 +1730,7 @@ class HashcatGUI(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setOrganizationName("MyCompany"); app.setApplicationName("HashcatGUI")
     window = HashcatGUI()
     window.show()
     sys.exit(app.exec())
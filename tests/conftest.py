@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bench"))
+
+
+@pytest.fixture(scope="session")
+def qapp(tmp_path_factory):
+    from PySide6.QtCore import QSettings, QStandardPaths
+    from PySide6.QtWidgets import QApplication
+    # Keep the tests away from the user's settings and caches
+    settings_dir = str(tmp_path_factory.mktemp("settings"))
+    for settings_format in (QSettings.NativeFormat, QSettings.IniFormat): QSettings.setPath(settings_format, QSettings.UserScope, settings_dir)
+    QStandardPaths.setTestModeEnabled(True)
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(qapp):
+    from hashcat_gui import HashcatGUI
+    gui = HashcatGUI()
+    yield gui
+    gui.close()
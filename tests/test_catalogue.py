@@ -0,0 +1,67 @@
+import os
+
+from PySide6.QtCore import Qt
+
+from hashcat_gui import WordlistCatalogue, WordlistCatalogueDialog, charset_size, mask_keyspace, scan_catalogue_file
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+def entry_for(path, kind='wordlist'):
+    stat = os.stat(path)
+    return dict(scan_catalogue_file(path), mtime=stat.st_mtime, size=stat.st_size, kind=kind)
+
+
+def test_scan_counts_crlf_and_unterminated_lines(tmp_path):
+    crlf = scan_catalogue_file(write(tmp_path / "crlf.txt", b"abc\r\nde\r\n"))
+    assert crlf['lines'] == 2 and crlf['avg_length'] == 2.5
+    unterminated = scan_catalogue_file(write(tmp_path / "open.txt", b"abc\nde"))
+    assert unterminated['lines'] == 2 and unterminated['avg_length'] == 2.5
+    assert scan_catalogue_file(write(tmp_path / "empty.txt", b""))['lines'] == 0
+    assert crlf['fingerprint'] != unterminated['fingerprint']
+
+
+def test_scan_stops_when_asked(tmp_path):
+    assert scan_catalogue_file(write(tmp_path / "words.txt", b"a\n"), lambda: True) is None
+
+
+def test_mask_keyspace():
+    assert charset_size("?l?d_") == 37
+    assert mask_keyspace("?l?u?d") == 26 * 26 * 10
+    assert mask_keyspace("pass?d?d") == 100
+    assert mask_keyspace("?1?1?a", {'1': "?l?d"}) == 36 * 36 * 95
+    assert mask_keyspace("?2x", {'1': "abc"}) == 1
+
+
+def test_catalogue_lookup_line_count_and_duplicates(tmp_path):
+    words = tmp_path / "lists"; words.mkdir()
+    first, copy = write(words / "a.txt", b"x\ny\n"), write(words / "b.txt", b"x\ny\n")
+    other = write(words / "c.txt", b"z\n")
+    rules = write(words / "best.rule", b":\nc\nu\n")
+    catalogue = WordlistCatalogue(str(tmp_path / "cache" / "catalogue.json"))
+    catalogue.entries = {path: entry_for(path) for path in (first, copy, other)}
+    catalogue.entries[rules] = entry_for(rules, 'rule')
+    assert catalogue.lookup(first)['lines'] == 2 and catalogue.line_count(other) == 1
+    assert catalogue.line_count(str(words)) == 5
+    assert catalogue.duplicates() == {copy: first}
+    catalogue.save()
+    assert WordlistCatalogue(catalogue.cache_path).entries == catalogue.entries
+    write(words / "c.txt", b"z\nzz\n")
+    assert catalogue.lookup(other) is None and catalogue.line_count(str(tmp_path / "missing.txt")) is None
+
+
+def test_catalogue_dialog_sorts_entries(window, tmp_path):
+    paths = [write(tmp_path / name, data) for name, data in (("b.txt", b"1\n2\n"), ("a.txt", b"1\n2\n"), ("c.txt", b"1\n"))]
+    window.catalogue.entries = {path: entry_for(path) for path in paths}
+    dialog = WordlistCatalogueDialog(window, 'wordlist')
+    try:
+        assert dialog.table.rowCount() == 3
+        for column in range(len(dialog.COLUMNS)): dialog.table.sortByColumn(column, Qt.AscendingOrder)
+        dialog.table.sortByColumn(0, Qt.AscendingOrder)
+        assert [dialog.table.item(row, 0).text() for row in range(3)] == ["a.txt", "b.txt", "c.txt"]
+        assert dialog.table.item(1, 4).text() == "a.txt"
+    finally:
+        dialog.reject()
@@ -0,0 +1,51 @@
+from hashcat_gui import append_to_derived_wordlist, read_new_plaintexts, strip_options
+
+
+def test_lines_before_counts_physical_lines(tmp_path):
+    wordlist = tmp_path / "derived.txt"
+    wordlist.write_bytes(b"x\nx\n\ny")
+    assert append_to_derived_wordlist(str(wordlist), [b"y", b"z", b"z"]) == (4, 1)
+    assert wordlist.read_bytes() == b"x\nx\n\ny\nz\n"
+    assert append_to_derived_wordlist(str(wordlist), [b"w"]) == (5, 1)
+
+
+def test_read_new_plaintexts_from_offset(tmp_path):
+    potfile = tmp_path / "hashcat.potfile"
+    potfile.write_bytes(b"aa:old\n")
+    offset = potfile.stat().st_size
+    potfile.write_bytes(b"aa:old\nbb:salt:new1\ncc:$HEX[3a3a]\ndd:partial")
+    plaintexts, offset = read_new_plaintexts(str(potfile), offset)
+    assert plaintexts == [b"new1", b"$HEX[3a3a]"]
+    assert read_new_plaintexts(str(potfile), offset)[0] == []
+
+
+def test_strip_options_keeps_executable_and_positionals():
+    command = ["hashcat", "-a", "3", "-i", "--restore", "-m", "0", "hashes.txt", "?a?a"]
+    assert strip_options(command, valued=("-a",), flags=("-i", "--restore")) == ["hashcat", "-m", "0", "hashes.txt", "?a?a"]
+
+
+def test_feedback_writes_to_the_viewer_potfile(window, tmp_path):
+    window.path_input.setText("/opt/hashcat/hashcat")
+    window.hash_file_input.setText("hashes.txt")
+    window.potfile_viewer_path_input.setText(str(tmp_path / "gui.potfile"))
+    assert "--potfile-path" not in window.build_command_list()
+    window.controls['feedback_enabled'].setChecked(True)
+    command = window.build_command_list()
+    assert command[command.index("--potfile-path") + 1] == str(tmp_path / "gui.potfile")
+
+
+def test_feedback_without_potfile_path_refuses_to_run(window, tmp_path, monkeypatch):
+    import hashcat_gui
+    warnings, started = [], []
+    monkeypatch.setattr(hashcat_gui.QMessageBox, "warning", lambda *args: warnings.append(args[2]))
+    window._pre_run_checks = lambda *args, **kwargs: True
+    window._start_process = lambda command_list, clear_output=True: started.append(command_list)
+    window.path_input.setText("/opt/hashcat/hashcat")
+    window.hash_file_input.setText("hashes.txt")
+    window.potfile_viewer_path_input.setText("")
+    window.controls['feedback_enabled'].setChecked(True)
+    window.run_hashcat()
+    assert started == [] and "Potfile Viewer" in warnings[0]
+    window.potfile_viewer_path_input.setText(str(tmp_path / "gui.potfile"))
+    window.run_hashcat()
+    assert len(started) == 1 and window.feedback['potfile'] == str(tmp_path / "gui.potfile")
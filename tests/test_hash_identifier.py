@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from hashcat_gui import HashIdentifier, split_hash_file
+
+# Excerpt of "hashcat --example-hashes" (v6.2 layout) for the modes exercised below
+EXAMPLE_HASHES = """
+Hash mode #0
+  Name................: MD5
+  Example.Hash.Format.: plain
+  Example.Hash........: 8743b52063cd84097a65d1633f5c74f5
+Hash mode #10
+  Name................: md5($pass.$salt)
+  Example.Hash.Format.: plain
+  Example.Hash........: 01dfae6e5d4d90d9892622325959afbe:7050461
+Hash mode #100
+  Name................: SHA1
+  Example.Hash.Format.: plain
+  Example.Hash........: b89eaac7e61417341b710b727768294d0e6a277b
+Hash mode #500
+  Name................: md5crypt, MD5 (Unix), Cisco-IOS $1$ (MD5)
+  Example.Hash.Format.: plain
+  Example.Hash........: $1$28772684$iEwNOgGugqO9.bIz5sk8k/
+Hash mode #1000
+  Name................: NTLM
+  Example.Hash.Format.: plain
+  Example.Hash........: b4b9b02e6f09a9bd760f388b67351e2b
+Hash mode #1800
+  Name................: sha512crypt $6$, SHA512 (Unix)
+  Example.Hash.Format.: plain
+  Example.Hash........: $6$72820166$U4DVzpcYxgw7MVVDGGvB2/H5lRistD5.Ah4upwENR5UtffLR4X4SxSzfREv8z6wVl0jRFX40/KnYVvK4829kD1
+Hash mode #2500
+  Name................: WPA-EAPOL-PBKDF2
+  Example.Hash.Format.: hex
+  Example.Hash........: 4843505803000000
+Hash mode #3200
+  Name................: bcrypt $2*$, Blowfish (Unix)
+  Example.Hash.Format.: plain
+  Example.Hash........: $2a$05$LhayLxezLhK1LhWvKxCyLOj0j1u.Kj0jZ0pEmm134uzrQlFvQJLF6
+Hash mode #5500
+  Name................: NetNTLMv1 / NetNTLMv1+ESS
+  Example.Hash.Format.: plain
+  Example.Hash........: u4-netntlm::kNS:338d08f8e26de93300000000000000000000000000000000:9526fb8c23a90751cdd619b6cea564742e1e4bf33006ba41:cb8086049ec4736c
+Hash mode #5600
+  Name................: NetNTLMv2
+  Example.Hash.Format.: plain
+  Example.Hash........: admin::N46iSNekpT:08ca45b7d7ea58ee:88dcbe4446168966a153a0064958dac6:5c7830315c7830310000000000000b45c67103d07d7b95acd12ffa11230e0000000052920b85f78d013c31cdb3b92f5d765c783030
+Hash mode #7400
+  Name................: sha256crypt $5$, SHA256 (Unix)
+  Example.Hash.Format.: plain
+  Example.Hash........: $5$rounds=5000$GX7BopJZJxPc/KEK$le16UF8I2Anb.rOrn22AUPWvzUETDGefUmAV8AZkGcD
+Hash mode #13100
+  Name................: Kerberos 5, etype 23, TGS-REP
+  Example.Hash.Format.: plain
+  Example.Hash........: $krb5tgs$23$*user$realm$test/spn*$63386d22d359fe42230300d56852c9eb$891ad31d09ab89c6b3b8c5e5de6c06a7f49fd559d7a9a3c32576c8fedf705376cea582ab5938f7fc8bc741acf05c5990741b36ef4311fe3562a41b70a4ec6ecba849905f2385bb3799d92499909658c7287c49160276bca0006c350b0db4fd387adc27c01e9e9ad0c20ed53a7e6356dee2452e35eca2a6a1d1432796fc5c19d068978df74d3d0baf35c77de12456bf1144b6a750d11f55805f5a16ece2975246e2d026dce997fba34ac8757312e9e4e6272de35e20d52fb668c5ed
+Hash mode #22000
+  Name................: WPA-PBKDF2-PMKID+EAPOL
+  Example.Hash.Format.: plain
+  Example.Hash........: WPA*01*4d4fe7aac3a2cecab195321ceb99a7d0*fc690c158264*f4747f87f9f4*686173686361742d6573736964***
+"""
+
+rng = random.Random(0)
+
+
+def hexstr(length):
+    return "".join(rng.choice("0123456789abcdef") for _ in range(length))
+
+
+def crypt64(length):
+    return "".join(rng.choice("./0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz") for _ in range(length))
+
+
+@pytest.fixture(scope="module")
+def identifier():
+    return HashIdentifier(HashIdentifier.parse_example_hashes(EXAMPLE_HASHES))
+
+
+def test_parse_example_hashes_skips_binary_formats(identifier):
+    assert 2500 not in identifier.examples
+    assert identifier.examples[0] == "8743b52063cd84097a65d1633f5c74f5"
+
+
+@pytest.mark.parametrize("line, expected", [
+    (hexstr(32), {0, 1000}),
+    (hexstr(40), {100}),
+    (f"{hexstr(32)}:s4lty", {10}),
+    (f"$1${crypt64(8)}${crypt64(22)}", {500}),
+    (f"$6${crypt64(16)}${crypt64(86)}", {1800}),
+    (f"$6$rounds=656000${crypt64(16)}${crypt64(86)}", {1800}),
+    (f"$5${crypt64(16)}${crypt64(43)}", {7400}),
+    (f"$2y$12${crypt64(53)}", {3200}),
+    (f"jsmith::CORP:{hexstr(48)}:{hexstr(48)}:{hexstr(16)}", {5500}),
+    (f"jsmith::CORP:{hexstr(16)}:{hexstr(32)}:{hexstr(300)}", {5600}),
+    (f"j.smith::corp.example.com:{hexstr(16)}:{hexstr(32)}:{hexstr(412)}", {5600}),
+    (f"$krb5tgs$23$*svc_sql$CORP.LOCAL$MSSQLSvc/db01.corp.local:1433*${hexstr(32)}${hexstr(1200)}", {13100}),
+    (f"WPA*02*{hexstr(32)}*{hexstr(12)}*{hexstr(12)}*{hexstr(20)}*{hexstr(64)}*{hexstr(242)}*00", {22000}),
+    (f"WPA*01*{hexstr(32)}*{hexstr(12)}*{hexstr(12)}*{hexstr(14)}***", {22000}),
+])
+def test_identify_real_hash_lines(identifier, line, expected):
+    ranked, _ = identifier.identify([line])
+    assert ranked, f"no candidates for {line}"
+    best_share = ranked[0][1]
+    top_modes = {mode for mode, share, score in ranked if share == best_share and score == ranked[0][2]}
+    assert expected <= top_modes
+    assert best_share == 1.0
+
+
+def test_netntlm_versions_are_not_confused(identifier):
+    ranked, _ = identifier.identify([f"jsmith::CORP:{hexstr(48)}:{hexstr(48)}:{hexstr(16)}"])
+    assert 5600 not in {mode for mode, _, _ in ranked}
+
+
+def test_mixed_file_is_ranked_and_split(identifier, tmp_path):
+    lines = [hexstr(32) for _ in range(6)] + [f"$6${crypt64(8)}${crypt64(86)}" for _ in range(3)] + ["not a hash"]
+    path = tmp_path / "mixed.txt"
+    path.write_text("\n".join(lines) + "\n")
+    ranked, groups = identifier.identify(lines)
+    assert ranked[0][0] == 0 and ranked[0][1] == pytest.approx(0.6)
+    assert groups == {0: 6, 1800: 3, None: 1}
+    outputs = split_hash_file(identifier, str(path))
+    assert {mode: count for mode, (_, count) in outputs.items()} == {0: 6, 1800: 3, None: 1}
+    assert (tmp_path / "mixed.m1800.txt").read_text().splitlines() == lines[6:9]
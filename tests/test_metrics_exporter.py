@@ -0,0 +1,55 @@
+from hashcat_gui import MetricsExporter, parse_status_text
+
+LABELS = {'session': "hashcat", 'hash_mode': "1000", 'attack_mode': "0"}
+
+
+def screen(total, new=None, progress="1/3 (33.33%)"):
+    recovered = f"{total}/10 ({total * 10:.2f}%) Digests (total)"
+    if new is not None: recovered += f", {new}/10 ({new * 10:.2f}%) Digests (new)"
+    return parse_status_text(f"Status...........: Running\nRecovered........: {recovered}\nProgress.........: {progress}\n")
+
+
+def value(exporter, name):
+    line = next(line for line in exporter.render().splitlines() if line.startswith(name + "{"))
+    return float(line.rsplit(" ", 1)[1])
+
+
+def test_recovered_new_is_parsed():
+    status = screen(5, new=2)
+    assert status['recovered'][0] == 5 and status['recovered_new'][0] == 2
+
+
+def test_cracked_total_uses_new_digests_across_runs():
+    exporter = MetricsExporter()
+    for run in range(2):
+        exporter.update_from_status(screen(4, new=0), LABELS)
+        exporter.update_from_status(screen(6, new=2), LABELS)
+        exporter.mark_finished(LABELS)
+    assert value(exporter, "hashcat_cracked_total") == 4
+
+
+def test_cracked_total_without_new_figure_uses_first_screen_as_baseline():
+    exporter = MetricsExporter()
+    for run in range(2):
+        exporter.update_from_status(screen(4), LABELS)
+        exporter.update_from_status(screen(5), LABELS)
+        exporter.mark_finished(LABELS)
+    assert value(exporter, "hashcat_cracked_total") == 2
+
+
+def test_progress_ratio_is_exact():
+    exporter = MetricsExporter()
+    exporter.update_from_status(screen(0, progress="1/1200 (0.08%)"), LABELS)
+    assert value(exporter, "hashcat_progress_ratio") == 1 / 1200
+
+
+def test_finished_run_keeps_only_counters():
+    exporter = MetricsExporter()
+    status = parse_status_text("Status...........: Running\nSpeed.#1.........:  1234.5 MH/s (1.00ms)\nHardware.Mon.#1..: Temp: 91c Util: 99%\n"
+                               "Recovered........: 1/10 (10.00%) Digests (total), 1/10 (10.00%) Digests (new)\nProgress.........: 1/3 (33.33%)\n")
+    exporter.update_from_status(status, LABELS)
+    assert "hashcat_device_temperature_celsius" in exporter.render()
+    exporter.mark_finished(LABELS)
+    names = {line.split("{")[0] for line in exporter.render().splitlines() if not line.startswith("#")}
+    assert names == {"hashcat_running", "hashcat_status_updates_total", "hashcat_cracked_total"}
+    assert value(exporter, "hashcat_running") == 0
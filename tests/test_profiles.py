@@ -0,0 +1,43 @@
+def test_old_profile_keeps_defaults_of_new_controls(window):
+    window.load_settings_dict({'hashcat_executable_path': "/opt/hashcat/hashcat", 'hash_file': "hashes.txt", 'brain_client': True, 'feedback_enabled': True})
+    assert window.controls['brain_host'].text() == ""
+    assert window.controls['feedback_wordlist'].text() == ""
+    assert window.controls['feedback_rules'].text() == ""
+    command = window.build_command_list()
+    assert "--brain-host" not in command and "None" not in command
+
+
+def test_profile_round_trip(window):
+    window.controls['brain_host'].setText("10.0.0.5")
+    window.controls['governor_pause_temp'].setValue(85)
+    settings = window.get_settings_dict()
+    window.controls['brain_host'].setText("")
+    window.load_settings_dict(settings)
+    assert window.controls['brain_host'].text() == "10.0.0.5"
+    assert window.controls['governor_pause_temp'].value() == 85
+
+
+def test_brain_password_is_masked_in_displayed_command(window):
+    window.path_input.setText("/opt/hashcat/hashcat")
+    window.hash_file_input.setText("hashes.txt")
+    window.controls['brain_client'].setChecked(True)
+    window.controls['brain_password'].setText("s3cret")
+    assert "s3cret" in window.build_command_list()
+    assert "s3cret" not in window.command_output_display.text()
+    assert "--brain-password '********'" in window.command_output_display.text()
+
+
+def test_brain_server_that_fails_to_start_is_reset(window, tmp_path):
+    from PySide6.QtTest import QTest
+    missing = tmp_path / "hashcat"
+    missing.write_text("")
+    missing.chmod(0o644)
+    window.path_input.setText(str(missing))
+    window._pre_run_checks = lambda *args, **kwargs: True
+    window.toggle_brain_server()
+    for _ in range(50):
+        if window.brain_process is None:
+            break
+        QTest.qWait(100)
+    assert window.brain_server_label.text() == "Stopped"
+    assert window.brain_server_button.text() == "Start Brain Server"
@@ -0,0 +1,92 @@
+import os
+import re
+
+import pytest
+from recording import read_recording
+
+from hashcat_gui import ThermalGovernor, parse_status_text
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bench", "fixtures", "status_timer_run.jsonl.gz")
+
+
+class FakeClock:
+    def __init__(self): self.now = 0.0
+    def __call__(self): return self.now
+
+
+@pytest.fixture(scope="module")
+def status_screens():
+    _, chunks, _ = read_recording(FIXTURE)
+    output = b"".join(data for _, data in chunks).decode()
+    screens = [parse_status_text(part) for part in re.split(r"(?m)^(?=Session\.+:)", output)]
+    return [screen for screen in screens if 'temp' in screen]
+
+
+def run_governor(screens, downshift=False, workload=3, cool_per_second=2):
+    """Feed screens one second apart; while paused the devices cool from the temperature they were paused at."""
+    keys, clock = [], FakeClock()
+    governor = ThermalGovernor(keys.append, lambda message: None, workload, pause_temp=90, resume_temp=80, downshift=downshift, clock=clock)
+    paused_temp = None
+    for screen in screens:
+        clock.now += 1
+        if governor.state == 'paused':
+            paused_temp -= cool_per_second
+            screen = dict(screen, temp={device: paused_temp for device in screen['temp']})
+        action = governor.feed(screen)
+        if action == 'p': paused_temp = max(screen['temp'].values())
+        if action == 'c': break
+    return governor, keys, clock
+
+
+def test_fixture_runs_hot(status_screens):
+    assert max(max(screen['temp'].values()) for screen in status_screens) >= 90
+
+
+def test_pause_and_resume_alternate(status_screens):
+    governor, keys, _ = run_governor(status_screens)
+    assert keys and keys[0] == 'p'
+    assert keys == ['p', 'r'] * (len(keys) // 2) + ['p'] * (len(keys) % 2)
+    assert 'r' in keys
+    assert governor.restart_workload is None
+
+
+def test_downshift_checkpoints_and_steps_down_to_pausing(status_screens):
+    governor, keys, clock = run_governor(status_screens, downshift=True, workload=3)
+    assert keys == ['c'] and governor.state == 'checkpointing'
+    assert governor.restart_workload == 2 and governor.restore_point > 0
+    governor.restarted()
+    assert governor.workload == 2 and governor.state == 'running' and governor.restart_workload is None
+    hot = {'temp': {'1': 95}}
+    assert governor.feed(hot) == 'c' and governor.restart_workload == 1
+    governor.restarted()
+    clock.now += 10
+    assert governor.feed(hot) == 'p'
+    assert governor.feed({'temp': {'1': 80}}) == 'r'
+    assert keys == ['c', 'c', 'p', 'r']
+
+
+def test_resume_temperature_stays_below_throttle_temperature(window):
+    pause_temp, resume_temp = window.controls['governor_pause_temp'], window.controls['governor_resume_temp']
+    pause_temp.setValue(70)
+    assert resume_temp.value() == 69 and resume_temp.maximum() == 69
+    resume_temp.setValue(75)
+    assert resume_temp.value() == 69
+
+
+def test_downshift_restart_drops_restore(window):
+    started = []
+    window._start_process = lambda command_list, clear_output=True: started.append(command_list)
+    window.last_command_list = ["hashcat", "--session", "s1", "--restore", "-w", "3", "-s", "10", "-m", "0", "hashes.txt", "words.txt"]
+    window.governor = ThermalGovernor(lambda key: None, lambda message: None, 3, downshift=True)
+    window.governor.restart_workload, window.governor.restore_point = 2, 500
+    window._restart_with_lower_workload()
+    assert started == [["hashcat", "-w", "2", "-s", "500", "--session", "s1", "-m", "0", "hashes.txt", "words.txt"]]
+
+
+def test_increment_run_pauses_instead_of_downshifting(window):
+    window.controls['governor_enabled'].setChecked(True)
+    window.controls['governor_downshift'].setChecked(True)
+    assert window._create_governor(["hashcat", "-a", "3", "-m", "0", "hashes.txt", "?a?a?a"]).downshift
+    governor = window._create_governor(["hashcat", "-a", "3", "-i", "--increment-min", "4", "-m", "0", "hashes.txt", "?a?a?a?a?a?a"])
+    assert not governor.downshift
+    assert governor.feed({'temp': {'1': 95}}) == 'p'